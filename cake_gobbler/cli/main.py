@@ -8,27 +8,68 @@ Main CLI module for the Cake Gobbler RAG system.
 This module provides the main CLI interface for the application.
 """
 
-from rich.traceback import install
-install()
-
 import sys
 import os
+
+# Pretty tracebacks are only worth the import/excepthook cost for humans at
+# a terminal; scripted callers can also opt out explicitly
+if sys.stdout.isatty() and os.environ.get("GOBBLER_NO_RICH_TB") != "1":
+    import click
+    import typer
+    from rich.traceback import install
+    install(show_locals=False, suppress=[typer, click])
+
 from dotenv import load_dotenv
 
 # Load environment variables first, before any other imports
 load_dotenv()
 
+import asyncio
+import atexit
 import json
+import logging
 import re
+from datetime import datetime
 from typing import Optional
+
+# The Weaviate client drives its gRPC traffic through an asyncio event loop
+# created via the global policy; uvloop lowers the per-call overhead when it
+# is installed (optional, POSIX only)
+if sys.platform != "win32":
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
+
+try:
+    # orjson parses the analysis/error blobs ~3x faster than stdlib json
+    # (its JSONDecodeError subclasses json.JSONDecodeError so the existing
+    # error handling works unchanged) and pretty-prints them far faster too
+    import orjson
+
+    json_loads = orjson.loads
+
+    def json_dumps_indent(obj) -> str:
+        """Pretty-print a JSON-serializable object with 2-space indent."""
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+except ImportError:
+    json_loads = json.loads
+
+    def json_dumps_indent(obj) -> str:
+        """Pretty-print a JSON-serializable object with 2-space indent."""
+        return json.dumps(obj, indent=2)
 import typer
-from rich.console import Console
+from rich.console import Console, Group
+from rich.live import Live
+from rich.progress import Progress
 from rich.table import Table
+from rich.text import Text
 
 from cake_gobbler.models.config import AppConfig, WeaviateConfig, ProcessingConfig
 from cake_gobbler.models.config import ProcessingConfig as DefaultConfig
-from cake_gobbler.core.ingestion import IngestionManager
 from cake_gobbler.core.db_manager import DatabaseManager
+from cake_gobbler.utils.cli_formatter import format_status_color, truncate_text
 from cake_gobbler.utils.logging import configure_logging
 from cake_gobbler.utils.file_utils import find_pdf_files
 
@@ -36,7 +77,60 @@ from cake_gobbler.utils.file_utils import find_pdf_files
 app = typer.Typer(help="Cake Gobbler RAG - PDF Ingestion System", no_args_is_help=True)
 console = Console()
 
-logger = configure_logging()
+# Handler setup (log files, rich handler) is deferred to the commands that
+# log; at import time we only take a handle on the shared logger
+logger = logging.getLogger("cake-gobbler")
+
+# Shared defaults for Typer options, built once instead of once per option
+_DEFAULTS = DefaultConfig()
+
+# Weaviate collection names must be PascalCase identifiers; compiled once at
+# module scope (\Z rather than $ so a trailing newline cannot sneak through)
+_COLLECTION_RE = re.compile(r'^[A-Z][a-zA-Z0-9_]*\Z')
+
+# Issue severity -> Rich color, shared by the diagnostics tables
+_SEVERITY_COLOR = {"high": "red", "medium": "yellow", "low": "blue"}
+
+# Pre-built pass/fail marks; Text objects carry the style directly, so the
+# row loops neither interpolate markup nor pay to re-parse it per row
+_OK_MARK = Text("✓", style="green")
+_FAIL_MARK = Text("✗", style="red")
+
+
+def _maybe_json_loads(payload: Optional[str]):
+    """
+    Parse a JSON payload, or return None when it is empty, clearly not JSON
+    (plain error strings are common), or malformed. The first-byte check
+    skips parser startup for the non-JSON case entirely.
+    """
+    if not payload or payload[0] not in "{[":
+        return None
+    try:
+        return json_loads(payload)
+    except json.JSONDecodeError:
+        return None
+
+
+def _validate_collection_name(collection: str) -> None:
+    """Exit with an error message if the collection name is invalid."""
+    if not _COLLECTION_RE.match(collection):
+        console.print("[bold red]Error: Collection name must start with a capital letter and contain only letters, numbers, and underscores.[/bold red]")
+        sys.exit(1)
+
+
+def _maybe_empty_cuda_cache() -> None:
+    """Release cached CUDA memory at exit, but only if torch was ever loaded."""
+    torch = sys.modules.get("torch")
+    try:
+        if torch is not None and torch.cuda.is_available():
+            torch.cuda.empty_cache()
+    except Exception:
+        pass
+
+
+# One cleanup hook for every command, instead of per-command finally blocks
+# that re-import torch even when the GPU was never touched
+atexit.register(_maybe_empty_cuda_cache)
 
 @app.command("ingest")
 def ingest_pdfs(
@@ -50,7 +144,8 @@ def ingest_pdfs(
     weaviate_grpc_host: str = typer.Option(os.environ.get("WEAVIATE_GRPC_HOST", "weaviate-grpc.weaviate"), "--weaviate-grpc-host", help="Weaviate gRPC host"),
     weaviate_grpc_port: int = typer.Option(os.environ.get("WEAVIATE_GRPC_PORT", 50051), "--weaviate-grpc-port", help="Weaviate gRPC port"),
     weaviate_timeout: int = typer.Option(os.environ.get("WEAVIATE_TIMEOUT", 60), "--weaviate-timeout", help="Weaviate connection timeout in seconds"),
-    db_path: str = typer.Option(DefaultConfig().db_path, "--db", help="SQLite database file for logging ingestions"),
+    weaviate_batch_size: int = typer.Option(os.environ.get("WEAVIATE_BATCH_SIZE", 100), "--weaviate-batch-size", help="Number of objects per Weaviate insert batch"),
+    db_path: str = typer.Option(_DEFAULTS.db_path, "--db", help="SQLite database file for logging ingestions"),
     verbose: bool = typer.Option(False, "--verbose", help="Enable verbose logging"),
     run_id: Optional[str] = typer.Option(None, "--run-id", help="Specify a run ID (optional)"),
     run_name: Optional[str] = typer.Option(None, "--run-name", help="Specify a human-readable name for the run"),
@@ -59,7 +154,6 @@ def ingest_pdfs(
     ray_workers: int = typer.Option(1, "--ray-workers", help="Number of Ray workers for embedding model parallelism"),
 ):
     """Ingest PDFs into Weaviate with analysis and chunking."""
-    # Set up logging with proper verbose flag
     if not pdf_path:
         console.print("[bold red]Error: --pdf argument is required for processing files.[/bold red]")
         console.print("Use --list-runs to see all runs or --run-stats <run_id> to see statistics for a specific run.")
@@ -70,11 +164,23 @@ def ingest_pdfs(
         sys.exit(1)
     
     # Validate collection name format
-    if not re.match(r'^[A-Z][a-zA-Z0-9_]*$', collection):
-        console.print("[bold red]Error: Collection name must start with a capital letter and contain only letters, numbers, and underscores.[/bold red]")
+    _validate_collection_name(collection)
+
+    # Set up logging with the requested verbosity, now that args are parsed
+    configure_logging(verbose=verbose)
+
+    # Find PDF files before spinning up Ray so an empty input fails fast
+    pdf_files = find_pdf_files(pdf_path)
+    if not pdf_files:
+        console.print(f"[bold red]Error: No PDF files found at {pdf_path}[/bold red]")
         sys.exit(1)
 
+    logger.info(f"Found {len(pdf_files)} PDF file(s) to process.")
+
+    # Deferred so read-only commands (list-runs, run-stats, ...) never pay
+    # the ray/torch import cost
     import ray
+    from cake_gobbler.core.ingestion import IngestionManager
 
     # Initialize Ray based on the provided address
     if ray_address:
@@ -97,7 +203,10 @@ def ingest_pdfs(
             http_port=weaviate_http_port,
             grpc_host=weaviate_grpc_host,
             grpc_port=weaviate_grpc_port,
-            timeout=weaviate_timeout
+            timeout=weaviate_timeout,
+            batch_size=weaviate_batch_size,
+            # Scale insert concurrency with the embedding workers feeding it
+            concurrent_requests=max(2, ray_workers)
         ),
         processing=ProcessingConfig(
             chunk_size=chunk_size,
@@ -111,14 +220,7 @@ def ingest_pdfs(
         run_id=run_id,
         run_name=run_name
     )
-    
-    # Find PDF files
-    pdf_files = find_pdf_files(pdf_path)
-    if not pdf_files:
-        console.print(f"[bold red]Error: No PDF files found at {pdf_path}[/bold red]")
-    
-    logger.info(f"Found {len(pdf_files)} PDF file(s) to process.")
-    
+
     # Initialize ingestion manager
     ingestion_manager = IngestionManager(app_config)
     
@@ -144,25 +246,44 @@ def ingest_pdfs(
         console.print(f"Using embedding model: [bold]{embedding_model}[/bold]")
 
         # For each database record for this colleciton, if there is no pdf_file that matches the file_path, delete it from weaviate
-        deleted = []
-        for record in ingestion_manager.db_manager.get_all_records(collection):
-            if record["file_path"] not in pdf_files:
-                ingestion_manager.weaviate_manager.delete(collection, record["file_path"])
-                deleted.append(record["file_path"])
-                # delete it from the database also
-                ingestion_manager.db_manager.delete_record(collection, record["file_path"])
+        pdf_files_set = frozenset(pdf_files)
+        deleted = [
+            record["file_path"]
+            for record in ingestion_manager.db_manager.get_all_records(collection)
+            if record["file_path"] not in pdf_files_set
+        ]
+        if deleted:
+            # One batch delete against Weaviate and one SQL statement,
+            # instead of a pair of round-trips per stale record
+            ingestion_manager.weaviate_manager.delete_by_file_paths(collection, deleted)
+            ingestion_manager.db_manager.delete_records_bulk(collection, deleted)
         console.print(f"Deleted {len(deleted)} records from Weaviate")
         
-        # Process each PDF file
-        for pdf_file in pdf_files:
-            status = ingestion_manager.ingest_file(pdf_file)
-            status_color = {
-                "success": "green",
-                "error": "red",
-                "skipped": "yellow",
-                "already_processed": "blue"
-            }.get(status, "white")
-            console.print(f"Status: [{status_color}]{status}[/{status_color}]")
+        # Process the PDF files, overlapping local parsing/chunking with
+        # remote embedding of the previous file. A single progress bar
+        # replaces the per-file status lines; only errors are printed.
+        # Batch the per-file log and progress writes instead of fsyncing
+        # per record. Every write records work that already happened, so on
+        # failure the open transaction is committed rather than rolled
+        # back, and a periodic checkpoint bounds what a hard crash loses.
+        counts = {"success": 0, "error": 0, "skipped": 0, "already_processed": 0}
+        with ingestion_manager.db_manager.batch(rollback_on_error=False), Progress(console=console) as progress:
+            task = progress.add_task("Ingesting PDFs", total=len(pdf_files))
+            for pdf_file, status in ingestion_manager.ingest_files(pdf_files):
+                counts[status] = counts.get(status, 0) + 1
+                if status == "error":
+                    progress.console.print(f"[red]Error ingesting {os.path.basename(pdf_file)}[/red]")
+                if sum(counts.values()) % 25 == 0:
+                    ingestion_manager.db_manager.checkpoint()
+                progress.update(
+                    task,
+                    advance=1,
+                    description=(
+                        f"Ingesting PDFs "
+                        f"(ok {counts['success']}, err {counts['error']}, "
+                        f"skip {counts['skipped'] + counts['already_processed']})"
+                    )
+                )
         
         # End the run and display statistics
         run_stats = ingestion_manager.end_run()
@@ -192,31 +313,17 @@ def ingest_pdfs(
                 ingestion_manager.close()
             except Exception as cleanup_e:
                 console.print(f"[bold red]Warning: Failed to clean up resources: {str(cleanup_e)}[/bold red]")
-            
-            # Import and clear CUDA cache if appropriate
-            try:
-                import torch
-                if torch.cuda.is_available():
-                    torch.cuda.empty_cache()
-            except Exception:
-                pass
 
 @app.command("list-runs")
 def list_runs(
-    db_path: str = typer.Option(DefaultConfig().db_path, "--db", help="SQLite database file"),
+    db_path: str = typer.Option(_DEFAULTS.db_path, "--db", help="SQLite database file"),
     limit: int = typer.Option(10, "--limit", help="Limit for listing runs"),
 ):
     """List all ingestion runs."""
     db_manager = DatabaseManager(db_path)
-    
-    # Get all runs
-    runs = db_manager.get_all_runs(limit=limit)
-    if not runs:
-        console.print("[bold yellow]No runs found in the database.[/bold yellow]")
-        return
-    
-    console.print(f"\n[bold cyan]Recent Runs (showing {len(runs)} of {limit} requested)[/bold cyan]")
-    
+
+    console.print(f"\n[bold cyan]Recent Runs (showing up to {limit})[/bold cyan]")
+
     # Create a table for run information
     table = Table(show_header=True, header_style="bold magenta", expand=False)
     table.add_column("Run ID", no_wrap=True)
@@ -226,56 +333,56 @@ def list_runs(
     table.add_column("Status")
     table.add_column("Files")
     table.add_column("Processing Time")
-    
-    # Add run information to the table
-    for run in runs:
-        # Calculate file counts
-        total_files = run.get("total_files", 0)
-        processed = run.get("processed_files", 0)
-        failed = run.get("failed_files", 0)
-        skipped = run.get("skipped_files", 0)
-        file_str = f"{processed}/{total_files} (F:{failed}, S:{skipped})"
-        
-        # Calculate processing time
-        processing_time = run.get("total_processing_time", 0)
-        if processing_time:
-            minutes, seconds = divmod(processing_time, 60)
-            hours, minutes = divmod(minutes, 60)
-            time_str = f"{int(hours)}h {int(minutes)}m {seconds:.2f}s"
-        else:
-            time_str = "In progress"
-        
-        # Determine status color
-        status = run.get("status", "N/A")
-        status_color = {
-            "running": "yellow",
-            "completed": "green",
-            "completed_with_errors": "yellow",
-            "failed": "red"
-        }.get(status, "white")
-        
-        # Get values from database columns
-        run_name = run.get("run_name", "N/A")
-        collection = run.get("collection", "N/A")
-        
-        table.add_row(
-            run.get("run_id", "N/A"),
-            run_name,
-            collection,
-            run.get("start_time", "N/A"),
-            f"[{status_color}]{status}[/{status_color}]",
-            file_str,
-            time_str
-        )
-    
-    console.print(table)
+
+    # Stream rows into the table as they come off the cursor instead of
+    # materializing every run first
+    run_count = 0
+    with Live(table, console=console, refresh_per_second=4):
+        for run in db_manager.iter_runs(limit=limit):
+            run_count += 1
+
+            # Calculate file counts
+            total_files = run.get("total_files", 0)
+            processed = run.get("processed_files", 0)
+            failed = run.get("failed_files", 0)
+            skipped = run.get("skipped_files", 0)
+            file_str = f"{processed}/{total_files} (F:{failed}, S:{skipped})"
+
+            # Calculate processing time
+            processing_time = run.get("total_processing_time", 0)
+            if processing_time:
+                minutes, seconds = divmod(processing_time, 60)
+                hours, minutes = divmod(minutes, 60)
+                time_str = f"{int(hours)}h {int(minutes)}m {seconds:.2f}s"
+            else:
+                time_str = "In progress"
+
+            # Get values from database columns
+            status = run.get("status", "N/A")
+            run_name = run.get("run_name", "N/A")
+            collection = run.get("collection", "N/A")
+
+            table.add_row(
+                run.get("run_id", "N/A"),
+                run_name,
+                collection,
+                run.get("start_time", "N/A"),
+                format_status_color(status),
+                file_str,
+                time_str
+            )
+
+    if run_count == 0:
+        console.print("[bold yellow]No runs found in the database.[/bold yellow]")
+        return
+
     console.print("\n[italic]To see detailed information for a specific run, use 'gobbler run-stats <run_id>'[/italic]")
 
 
 @app.command("run-stats")
 def run_stats(
     run_id: str = typer.Argument(..., help="Run ID to display statistics for"),
-    db_path: str = typer.Option(DefaultConfig().db_path, "--db", help="SQLite database file"),
+    db_path: str = typer.Option(_DEFAULTS.db_path, "--db", help="SQLite database file"),
     verbose: bool = typer.Option(False, "--verbose", help="Display detailed information"),
 ):
     """Show statistics for a specific ingestion run."""
@@ -287,9 +394,6 @@ def run_stats(
         console.print(f"[bold red]Run with ID '{run_id}' not found.[/bold red]")
         return
     
-    # Get ingestions for this run
-    ingestions = db_manager.get_ingestions_for_run(run_id)
-    
     # Get values from database columns
     run_name = run_info.get("run_name", "N/A")
     collection = run_info.get("collection", "N/A")
@@ -338,43 +442,33 @@ def run_stats(
     console.print(table)
     
     # Display ingestion information if verbose
-    if verbose and ingestions:
-        console.print(f"\n[bold cyan]Ingestion Information ({len(ingestions)} files)[/bold cyan]")
-        
+    if verbose:
+        console.print(f"\n[bold cyan]Ingestion Information[/bold cyan]")
+
         # Create a table for ingestion information
         ingestion_table = Table(show_header=True, header_style="bold magenta", expand=False)
         ingestion_table.add_column("File Path", no_wrap=True)
         ingestion_table.add_column("Status")
         ingestion_table.add_column("Time")
         ingestion_table.add_column("Issues")
-        
-        # Add ingestion information to the table
-        for ingestion in ingestions:
-            status = ingestion.get("status", "N/A")
-            status_color = {
-                "success": "green",
-                "error": "red",
-                "skipped": "yellow"
-            }.get(status, "white")
-            
-            # Try to parse error message as JSON for more detailed information
-            error_msg = ingestion.get("error_message", "None")
-            try:
-                error_data = json.loads(error_msg)
+
+        # Stream the run's ingestion records into the table
+        with Live(ingestion_table, console=console, refresh_per_second=4):
+            for ingestion in db_manager.iter_ingestions_for_run(run_id):
+                status = ingestion.get("status", "N/A")
+                # Use the structured message when the error is JSON; plain
+                # strings skip the parser entirely
+                error_msg = ingestion.get("error_message", "None")
+                error_data = _maybe_json_loads(error_msg)
                 if isinstance(error_data, dict) and "message" in error_data:
                     error_msg = error_data["message"]
-            except (json.JSONDecodeError, TypeError):
-                # Not JSON, use as is
-                pass
-            
-            ingestion_table.add_row(
-                os.path.basename(ingestion.get("file_path", "N/A")),
-                f"[{status_color}]{status}[/{status_color}]",
-                ingestion.get("ingestion_time", "N/A"),
-                error_msg[:150] + ("..." if len(error_msg) > 150 else "")
-            )
-        
-        console.print(ingestion_table)
+
+                ingestion_table.add_row(
+                    os.path.basename(ingestion.get("file_path", "N/A")),
+                    format_status_color(status),
+                    ingestion.get("ingestion_time", "N/A"),
+                    truncate_text(error_msg, 150)
+                )
 
 
 @app.command("query")
@@ -388,16 +482,14 @@ def query(
     weaviate_grpc_host: str = typer.Option(os.environ.get("WEAVIATE_GRPC_HOST", "weaviate-grpc.weaviate"), "--weaviate-grpc-host", help="Weaviate gRPC host"),
     weaviate_grpc_port: int = typer.Option(os.environ.get("WEAVIATE_GRPC_PORT", 50051), "--weaviate-grpc-port", help="Weaviate gRPC port"),
     weaviate_timeout: int = typer.Option(os.environ.get("WEAVIATE_TIMEOUT", 60), "--weaviate-timeout", help="Weaviate connection timeout in seconds"),
+    ray_address: Optional[str] = typer.Option(None, "--ray-address", help="Ray cluster address. If provided, the embedding model is cached in a detached actor and reused across query invocations."),
 ):
     """Search for chunks in a collection."""
-    from sentence_transformers import SentenceTransformer
-    from cake_gobbler.core.weaviate_manager import WeaviateManager
+    from cake_gobbler.core.weaviate_manager import get_weaviate_manager
     
     # Validate collection name format
-    if not re.match(r'^[A-Z][a-zA-Z0-9_]*$', collection):
-        console.print("[bold red]Error: Collection name must start with a capital letter and contain only letters, numbers, and underscores.[/bold red]")
-        sys.exit(1)
-    
+    _validate_collection_name(collection)
+
     # Create Weaviate configuration
     weaviate_config = WeaviateConfig(
         http_host=weaviate_http_host,
@@ -407,82 +499,79 @@ def query(
         timeout=weaviate_timeout
     )
     
-    # Create Weaviate manager
-    weaviate_manager = WeaviateManager(weaviate_config)
-    model = None
-    
+    # Get the shared Weaviate manager; the connection and any CUDA cache are
+    # released by the atexit hooks registered at module scope
+    weaviate_manager = get_weaviate_manager(weaviate_config)
+
+    # Display connection info
+    console.print(f"Weaviate HTTP connection: [bold]{weaviate_http_host}:{weaviate_http_port}[/bold]")
+    console.print(f"Weaviate gRPC connection: [bold]{weaviate_grpc_host}:{weaviate_grpc_port}[/bold]")
+
+    # Connect to Weaviate
     try:
-        # Display connection info
-        console.print(f"Weaviate HTTP connection: [bold]{weaviate_http_host}:{weaviate_http_port}[/bold]")
-        console.print(f"Weaviate gRPC connection: [bold]{weaviate_grpc_host}:{weaviate_grpc_port}[/bold]")
-        
-        # Connect to Weaviate
-        try:
-            weaviate_manager.connect()
-            console.print("[bold green]Successfully connected to Weaviate![/bold green]")
-        except ConnectionError as e:
-            console.print(f"[bold red]Error: Could not connect to Weaviate: {str(e)}[/bold red]")
-            console.print(f"[bold yellow]Please verify that Weaviate is running at {weaviate_http_host}:{weaviate_http_port}[/bold yellow]")
-            sys.exit(1)
-        
+        weaviate_manager.connect()
+        console.print("[bold green]Successfully connected to Weaviate![/bold green]")
+    except ConnectionError as e:
+        console.print(f"[bold red]Error: Could not connect to Weaviate: {str(e)}[/bold red]")
+        console.print(f"[bold yellow]Please verify that Weaviate is running at {weaviate_http_host}:{weaviate_http_port}[/bold yellow]")
+        sys.exit(1)
+
+    if ray_address:
+        # Keep the loaded model in a detached named actor on the cluster so
+        # repeated query invocations pay encode cost only, not load cost
+        import ray
+        from cake_gobbler.core.embedding_model_manager import EmbeddingModelManager
+
+        console.print(f"Connecting to Ray cluster at: [bold]{ray_address}[/bold]")
+        ray.init(address=ray_address, namespace="gobbler", ignore_reinit_error=True)
+
+        embedder = EmbeddingModelManager.options(
+            name="query-embedder", lifetime="detached", get_if_exists=True
+        ).remote()
+        # No-op on the actor if this model is already loaded
+        ray.get(embedder.load_embedding_model.remote(embedding_model))
+
+        console.print(f"Embedding query: [italic]\"{query_text}\"[/italic]")
+        query_embedding = ray.get(embedder.embed_chunks.remote([query_text]))[0].tolist()
+    else:
+        from sentence_transformers import SentenceTransformer
+
         # Load embedding model
         console.print(f"Loading embedding model: [bold]{embedding_model}[/bold]...")
         model = SentenceTransformer(embedding_model)
-        
+
         # Embed query
         console.print(f"Embedding query: [italic]\"{query_text}\"[/italic]")
         query_embedding = model.encode(query_text).tolist()
-        
-        # Search
-        console.print(f"Searching collection: [bold]{collection}[/bold]")
-        results = weaviate_manager.search(collection, query_embedding, limit=limit)
-        
-        # Display results
-        console.print(f"\n[bold green]Search Results:[/bold green]")
-        
-        for i, result in enumerate(results):
-            console.print(f"\n[bold cyan]Result {i+1}:[/bold cyan]")
-            score = result.get('score')
-            if score is not None:
-                console.print(f"[bold]Score:[/bold] {score:.4f}")
-            else:
-                console.print("[bold]Score:[/bold] N/A")
-            console.print(f"[bold]Source:[/bold] {result['metadata'].get('source', 'Unknown')}")
-            console.print(f"[bold]Text:[/bold] {result['text'][:300]}...")
-    finally:
-        # Proper cleanup of resources
-        if weaviate_manager:
-            try:
-                weaviate_manager.close()
-            except Exception as e:
-                console.print(f"[bold red]Warning: Failed to close Weaviate connection: {str(e)}[/bold red]")
-        
-        # Clean up any CUDA resources from the model
-        if model:
-            import torch
-            try:
-                # Clear CUDA cache
-                if torch.cuda.is_available():
-                    torch.cuda.empty_cache()
-            except Exception as e:
-                console.print(f"[bold red]Warning: Failed to clear CUDA cache: {str(e)}[/bold red]")
+
+    # Search
+    console.print(f"Searching collection: [bold]{collection}[/bold]")
+    results = weaviate_manager.search(collection, query_embedding, limit=limit)
+
+    # Display results
+    console.print(f"\n[bold green]Search Results:[/bold green]")
+
+    for i, result in enumerate(results):
+        console.print(f"\n[bold cyan]Result {i+1}:[/bold cyan]")
+        score = result.get('score')
+        if score is not None:
+            console.print(f"[bold]Score:[/bold] {score:.4f}")
+        else:
+            console.print("[bold]Score:[/bold] N/A")
+        console.print(f"[bold]Source:[/bold] {result['metadata'].get('source', 'Unknown')}")
+        console.print(f"[bold]Text:[/bold] {result['text'][:300]}...")
 
 
 @app.command("list-ingestions")
 def list_ingestions(
-    db_path: str = typer.Option(DefaultConfig().db_path, "--db", help="SQLite database file"),
+    db_path: str = typer.Option(_DEFAULTS.db_path, "--db", help="SQLite database file"),
     limit: int = typer.Option(20, "--limit", help="Maximum number of ingestions to show"),
 ):
     """List recent ingestion records."""
     db_manager = DatabaseManager(db_path)
-    ingestions = db_manager.get_ingestion_log(limit=limit)
-    
-    if not ingestions:
-        console.print("[bold yellow]No ingestion records found.[/bold yellow]")
-        return
-    
-    console.print(f"\n[bold cyan]Recent Ingestions (showing {len(ingestions)} of {limit} requested)[/bold cyan]")
-    
+
+    console.print(f"\n[bold cyan]Recent Ingestions (showing up to {limit})[/bold cyan]")
+
     # Create a table for ingestion information
     table = Table(show_header=True, header_style="bold magenta", expand=False)
     table.add_column("ID", no_wrap=True)
@@ -491,50 +580,42 @@ def list_ingestions(
     table.add_column("Run ID", no_wrap=True)
     table.add_column("Time")
     table.add_column("Issues/Notes")
-    
-    # Add ingestion information to the table
-    for ingestion in ingestions:
-        status = ingestion.get("status", "N/A")
-        status_color = {
-            "success": "green",
-            "error": "red",
-            "skipped": "yellow",
-            "already_processed": "blue"
-        }.get(status, "white")
-        
-        filename = os.path.basename(ingestion.get("file_path", "N/A"))
-        
-        notes = ingestion.get("error_message", "")
-        # Try to parse as JSON for more detailed information
-        try:
-            error_data = json.loads(notes)
+
+    # Stream rows into the table as they come off the cursor instead of
+    # materializing every record first
+    ingestion_count = 0
+    with Live(table, console=console, refresh_per_second=4):
+        for ingestion in db_manager.iter_ingestion_log(limit=limit):
+            ingestion_count += 1
+            status = ingestion.get("status", "N/A")
+            filename = os.path.basename(ingestion.get("file_path", "N/A"))
+
+            # Use the structured message when the error is JSON; plain
+            # strings skip the parser entirely
+            notes = ingestion.get("error_message", "")
+            error_data = _maybe_json_loads(notes)
             if isinstance(error_data, dict) and "message" in error_data:
                 notes = error_data["message"]
-        except (json.JSONDecodeError, TypeError):
-            # Not JSON, use as is
-            pass
-            
-        if not notes and status == "success":
-            # Extract some info from analysis_result
-            analysis_json = ingestion.get("analysis_result")
-            if analysis_json:
-                try:
-                    analysis = json.loads(analysis_json)
-                    num_pages = analysis.get("num_pages", 0)
-                    notes = f"Pages: {num_pages}"
-                except json.JSONDecodeError:
-                    pass
-        
-        table.add_row(
-            str(ingestion.get("id", "-")),
-            filename,
-            f"[{status_color}]{status}[/{status_color}]",
-            ingestion.get("run_id", "N/A"),
-            ingestion.get("ingestion_time", "N/A").split("T")[0],  # Just the date part
-            notes[:50] + ("..." if len(notes) > 50 else "")
-        )
-    
-    console.print(table)
+
+            if not notes and status == "success":
+                # Extract some info from analysis_result
+                analysis = _maybe_json_loads(ingestion.get("analysis_result"))
+                if analysis is not None:
+                    notes = f"Pages: {analysis.get('num_pages', 0)}"
+
+            table.add_row(
+                str(ingestion.get("id", "-")),
+                filename,
+                format_status_color(status),
+                ingestion.get("run_id", "N/A"),
+                ingestion.get("ingestion_time", "N/A").split("T")[0],  # Just the date part
+                truncate_text(notes, 50)
+            )
+
+    if ingestion_count == 0:
+        console.print("[bold yellow]No ingestion records found.[/bold yellow]")
+        return
+
     console.print("\n[italic]To see detailed information for a specific ingestion, use 'gobbler ingestion-details --id <id>'[/italic]")
 
 
@@ -542,7 +623,7 @@ def list_ingestions(
 def ingestion_details(
     id: int = typer.Option(None, "--id", help="ID of the ingestion record"),
     file: str = typer.Option(None, "--file", help="Path to the PDF file"),
-    db_path: str = typer.Option(DefaultConfig().db_path, "--db", help="SQLite database file"),
+    db_path: str = typer.Option(_DEFAULTS.db_path, "--db", help="SQLite database file"),
 ):
     """Show detailed information about a specific ingestion."""
     if not id and not file:
@@ -554,12 +635,7 @@ def ingestion_details(
     # Get ingestion record
     ingestion = None
     if id:
-        # This is a placeholder since we don't have a specific method to get by ID
-        ingestions = db_manager.get_ingestion_log(limit=1000)
-        for record in ingestions:
-            if record.get("id") == id:
-                ingestion = record
-                break
+        ingestion = db_manager.get_ingestion_by_id(id)
     elif file:
         ingestion = db_manager.get_ingestion_by_file(file)
     
@@ -582,221 +658,254 @@ def ingestion_details(
     table.add_row("Run ID", ingestion.get("run_id", "N/A"))
     table.add_row("Ingestion Time", ingestion.get("ingestion_time", "N/A"))
     
-    # Add error message if any
+    # Parse the error and analysis payloads once; every section below reads
+    # from the cached dicts instead of re-running json.loads
     error_message = ingestion.get("error_message", "")
+    error_data = _maybe_json_loads(error_message)
+
+    analysis_json = ingestion.get("analysis_result")
+    analysis = _maybe_json_loads(analysis_json)
+
+    # Add error message if any
     if error_message:
-        # Try to parse as JSON for detailed error information
-        try:
-            error_data = json.loads(error_message)
-            if isinstance(error_data, dict) and "message" in error_data:
-                # This is a structured error message with diagnostics
-                table.add_row("Error Message", error_data["message"])
-                
-                # Add extraction diagnostics if available
-                if "extraction_diagnostics" in error_data:
-                    extraction = error_data["extraction_diagnostics"]
-                    if extraction:
-                        table.add_row("Extraction Failure", extraction.get("failure_reason", "Unknown"))
-                        table.add_row("Failure Details", extraction.get("failure_details", "No details"))
-                        
-                        # Add page count if available
-                        if "page_count" in extraction:
-                            table.add_row("Page Count", str(extraction["page_count"]))
-                        
-                        # Add extraction attempts if available
-                        attempts = extraction.get("extraction_attempts", [])
-                        if attempts:
-                            attempt_details = []
-                            for i, attempt in enumerate(attempts):
-                                status = "✓" if attempt.get("success", False) else "✗"
-                                encoding = attempt.get("encoding", "unknown")
-                                note = f" ({attempt.get('note')})" if "note" in attempt else ""
-                                attempt_details.append(f"{status} {encoding}{note}")
-                            
-                            table.add_row("Extraction Attempts", ", ".join(attempt_details))
-                
-                # Add analysis diagnostics if available
-                if "analysis_diagnostics" in error_data:
-                    analysis_diag = error_data["analysis_diagnostics"]
-                    if analysis_diag:
-                        if "issues_found" in analysis_diag and analysis_diag["issues_found"]:
-                            table.add_row("Issues Found", ", ".join(analysis_diag["issues_found"]))
-                        
-                        if "primary_rejection_reason" in analysis_diag:
-                            table.add_row("Primary Rejection Reason", analysis_diag["primary_rejection_reason"] or "None")
-            else:
-                # Just a simple JSON string or object
-                table.add_row("Error Message", error_message)
-        except json.JSONDecodeError:
-            # Not JSON, just a regular string
+        if isinstance(error_data, dict) and "message" in error_data:
+            # This is a structured error message with diagnostics
+            table.add_row("Error Message", error_data["message"])
+
+            # Add extraction diagnostics if available
+            if "extraction_diagnostics" in error_data:
+                extraction = error_data["extraction_diagnostics"]
+                if extraction:
+                    table.add_row("Extraction Failure", extraction.get("failure_reason", "Unknown"))
+                    table.add_row("Failure Details", extraction.get("failure_details", "No details"))
+
+                    # Add page count if available
+                    if "page_count" in extraction:
+                        table.add_row("Page Count", str(extraction["page_count"]))
+
+                    # Add extraction attempts if available
+                    attempts = extraction.get("extraction_attempts", [])
+                    if attempts:
+                        attempt_details = []
+                        for i, attempt in enumerate(attempts):
+                            status = "✓" if attempt.get("success", False) else "✗"
+                            encoding = attempt.get("encoding", "unknown")
+                            note = f" ({attempt.get('note')})" if "note" in attempt else ""
+                            attempt_details.append(f"{status} {encoding}{note}")
+
+                        table.add_row("Extraction Attempts", ", ".join(attempt_details))
+
+            # Add analysis diagnostics if available
+            if "analysis_diagnostics" in error_data:
+                analysis_diag = error_data["analysis_diagnostics"]
+                if analysis_diag:
+                    if "issues_found" in analysis_diag and analysis_diag["issues_found"]:
+                        table.add_row("Issues Found", ", ".join(analysis_diag["issues_found"]))
+
+                    if "primary_rejection_reason" in analysis_diag:
+                        table.add_row("Primary Rejection Reason", analysis_diag["primary_rejection_reason"] or "None")
+        else:
+            # Not structured JSON, just a regular string
             table.add_row("Error Message", error_message)
-    
-    # Parse analysis_result if available
-    analysis_json = ingestion.get("analysis_result")
-    if analysis_json:
-        try:
-            analysis = json.loads(analysis_json)
-            table.add_row("Pages", str(analysis.get("num_pages", 0)))
-            table.add_row("File Size", f"{analysis.get('filesize', 0) / 1024 / 1024:.2f} MB")
-            table.add_row("Encrypted", "Yes" if analysis.get("is_encrypted", False) else "No")
-            table.add_row("Damaged", "Yes" if analysis.get("is_damaged", False) else "No")
+
+    # Add analysis details if available
+    if analysis is not None:
+        table.add_row("Pages", str(analysis.get("num_pages", 0)))
+        table.add_row("File Size", f"{analysis.get('filesize', 0) / 1024 / 1024:.2f} MB")
+        table.add_row("Encrypted", "Yes" if analysis.get("is_encrypted", False) else "No")
+        table.add_row("Damaged", "Yes" if analysis.get("is_damaged", False) else "No")
+        
+        # Add encoding types
+        encoding_types = analysis.get("encoding_types", [])
+        if encoding_types:
+            table.add_row("Encoding Types", ", ".join(encoding_types))
+        
+        # Add font information
+        fonts = analysis.get("fonts", [])
+        if fonts:
+            font_types = set(font.get("type", "") for font in fonts)
+            table.add_row("Font Types", ", ".join(font_types))
+            table.add_row("Fonts Count", str(len(fonts)))
+        
+        # Add issues
+        issues = analysis.get("issues", [])
+        if issues:
+            issue_types = [issue.get("type", "") for issue in issues]
+            table.add_row("Issues", ", ".join(issue_types))
             
-            # Add encoding types
-            encoding_types = analysis.get("encoding_types", [])
-            if encoding_types:
-                table.add_row("Encoding Types", ", ".join(encoding_types))
+            # Add detailed issues
+            issues_details = []
+            for i, issue in enumerate(issues):
+                issue_text = f"{issue.get('type', '')}: {issue.get('description', '')} (Severity: {issue.get('severity', '')})"
+                issues_details.append(issue_text)
             
-            # Add font information
-            fonts = analysis.get("fonts", [])
-            if fonts:
-                font_types = set(font.get("type", "") for font in fonts)
-                table.add_row("Font Types", ", ".join(font_types))
-                table.add_row("Fonts Count", str(len(fonts)))
+            # Instead of adding many rows, add one detailed row that can wrap properly
+            if issues_details:
+                table.add_row("Issues Details", "\n".join(issues_details))
+        
+        # Check for diagnostics in metadata
+        if "metadata" in analysis and "diagnostics" in analysis["metadata"]:
+            diagnostics = analysis["metadata"]["diagnostics"]
             
-            # Add issues
-            issues = analysis.get("issues", [])
-            if issues:
-                issue_types = [issue.get("type", "") for issue in issues]
-                table.add_row("Issues", ", ".join(issue_types))
-                
-                # Add detailed issues
-                issues_details = []
-                for i, issue in enumerate(issues):
-                    issue_text = f"{issue.get('type', '')}: {issue.get('description', '')} (Severity: {issue.get('severity', '')})"
-                    issues_details.append(issue_text)
-                
-                # Instead of adding many rows, add one detailed row that can wrap properly
-                if issues_details:
-                    table.add_row("Issues Details", "\n".join(issues_details))
+            # Add acceptance check diagnostics
+            if "acceptance_check" in diagnostics:
+                acceptance = diagnostics["acceptance_check"]
+                if "issues_found" in acceptance and acceptance["issues_found"]:
+                    table.add_row("Analysis Issues", ", ".join(acceptance["issues_found"]))
             
-            # Check for diagnostics in metadata
-            if "metadata" in analysis and "diagnostics" in analysis["metadata"]:
-                diagnostics = analysis["metadata"]["diagnostics"]
-                
-                # Add acceptance check diagnostics
-                if "acceptance_check" in diagnostics:
-                    acceptance = diagnostics["acceptance_check"]
-                    if "issues_found" in acceptance and acceptance["issues_found"]:
-                        table.add_row("Analysis Issues", ", ".join(acceptance["issues_found"]))
-                
-                # Add text extraction diagnostics
-                if "text_extraction" in diagnostics:
-                    extraction = diagnostics["text_extraction"]
-                    if extraction:
-                        if "failure_reason" in extraction:
-                            table.add_row("Extraction Failure", extraction["failure_reason"])
-                            table.add_row("Failure Details", extraction.get("failure_details", "No details"))
-        except json.JSONDecodeError:
-            console.print("[bold yellow]Failed to parse analysis results.[/bold yellow]")
-    
+            # Add text extraction diagnostics
+            if "text_extraction" in diagnostics:
+                extraction = diagnostics["text_extraction"]
+                if extraction:
+                    if "failure_reason" in extraction:
+                        table.add_row("Extraction Failure", extraction["failure_reason"])
+                        table.add_row("Failure Details", extraction.get("failure_details", "No details"))
+    elif analysis_json:
+        console.print("[bold yellow]Failed to parse analysis results.[/bold yellow]")
+
     console.print(table)
-    
+
+    # Sparsely-populated records (the common case in bulk listings) are done
+    # after the summary table; skip the section machinery entirely
+    if analysis is None and error_data is None:
+        return
+
     # If we have detailed diagnostics, show them in a separate section
-    if analysis_json:
-        try:
-            analysis = json.loads(analysis_json)
-            if "metadata" in analysis and "diagnostics" in analysis["metadata"]:
-                console.print("\n[bold cyan]Detailed Diagnostics[/bold cyan]")
-                console.print(json.dumps(analysis["metadata"]["diagnostics"], indent=2))
-        except json.JSONDecodeError:
-            pass
-    
-    # If we have a structured error message with diagnostics, show them in a separate section
-    if error_message:
-        try:
-            error_data = json.loads(error_message)
-            if isinstance(error_data, dict) and ("extraction_diagnostics" in error_data or "analysis_diagnostics" in error_data):
-                console.print("\n[bold cyan]Detailed Error Diagnostics[/bold cyan]")
-                
-                # Display extraction diagnostics
-                if "extraction_diagnostics" in error_data:
-                    console.print("\n[bold cyan]Text Extraction Diagnostics[/bold cyan]")
-                    extraction_diag = error_data["extraction_diagnostics"]
-                    if extraction_diag:
-                        # Display page count
-                        console.print(f"Page count: {extraction_diag.get('page_count', 0)}")
-                        
-                        # Display failure reason and details
-                        if "failure_reason" in extraction_diag:
-                            console.print(f"[bold red]Failure reason: {extraction_diag['failure_reason']}[/bold red]")
-                            console.print(f"Failure details: {extraction_diag.get('failure_details', 'No details')}")
-                        
-                        # Display extraction attempts
-                        attempts = extraction_diag.get("extraction_attempts", [])
-                        if attempts:
-                            console.print("\n[bold]Extraction attempts:[/bold]")
-                            attempts_table = Table(show_header=True, header_style="bold blue")
-                            attempts_table.add_column("Attempt")
-                            attempts_table.add_column("Encoding")
-                            attempts_table.add_column("Status")
-                            attempts_table.add_column("Notes", no_wrap=False, max_width=60)
-                            
-                            for i, attempt in enumerate(attempts):
-                                status = "✓" if attempt.get("success", False) else "✗"
-                                status_color = "green" if attempt.get("success", False) else "red"
-                                encoding = attempt.get("encoding", "unknown")
-                                note = attempt.get("note", "")
-                                error = attempt.get("error", "")
-                                if error and not note:
-                                    note = error
-                                
-                                attempts_table.add_row(
-                                    str(i+1),
-                                    encoding,
-                                    f"[{status_color}]{status}[/{status_color}]",
-                                    note
-                                )
-                            
-                            console.print(attempts_table)
-                
-                # Display analysis diagnostics
-                if "analysis_diagnostics" in error_data:
-                    console.print("\n[bold cyan]Analysis Diagnostics[/bold cyan]")
-                    analysis_diag = error_data["analysis_diagnostics"]
-                    if analysis_diag:
-                        if "issues_found" in analysis_diag and analysis_diag["issues_found"]:
-                            console.print("[bold]Issues found:[/bold]", ", ".join(analysis_diag["issues_found"]))
-                        
-                        if "primary_rejection_reason" in analysis_diag:
-                            console.print("[bold]Primary rejection reason:[/bold]", 
-                                         analysis_diag["primary_rejection_reason"] or "None")
-                        
-                        if "all_issues" in analysis_diag and analysis_diag["all_issues"]:
-                            console.print("\n[bold]All detected issues:[/bold]")
-                            issues_table = Table(show_header=True, header_style="bold blue")
-                            issues_table.add_column("Type")
-                            issues_table.add_column("Description", no_wrap=False, max_width=60)
-                            issues_table.add_column("Severity")
-                            issues_table.add_column("Pages")
-                            
-                            for issue in analysis_diag["all_issues"]:
-                                severity_color = {
-                                    "high": "red",
-                                    "medium": "yellow",
-                                    "low": "blue"
-                                }.get(issue.get("severity", "").lower(), "white")
-                                
-                                pages = "N/A"
-                                if issue.get("page_numbers"):
-                                    if isinstance(issue["page_numbers"], list):
-                                        pages = ", ".join(map(str, issue["page_numbers"]))
-                                    else:
-                                        pages = str(issue["page_numbers"])
-                                
-                                issues_table.add_row(
-                                    issue.get("type", "Unknown"),
-                                    issue.get("description", "No description"),
-                                    f"[{severity_color}]{issue.get('severity', 'Unknown')}[/{severity_color}]",
-                                    pages
-                                )
-                            
-                            console.print(issues_table)
-        except json.JSONDecodeError:
-            pass
+    if analysis is not None and "metadata" in analysis and "diagnostics" in analysis["metadata"]:
+        console.print("\n[bold cyan]Detailed Diagnostics[/bold cyan]")
+        rendered = json_dumps_indent(analysis["metadata"]["diagnostics"])
+        if len(rendered) > 64_000:
+            # Rich re-tokenizes and highlights everything it prints, which
+            # is expensive on multi-MB blobs; write those straight through
+            sys.stdout.write(rendered)
+            sys.stdout.write("\n")
+        else:
+            console.print(rendered)
+
+    # If we have a structured error message with diagnostics, show them in a
+    # separate section. The section is accumulated into one Group and printed
+    # with a single console.print, since each print call re-renders markup.
+    if isinstance(error_data, dict) and ("extraction_diagnostics" in error_data or "analysis_diagnostics" in error_data):
+        section = ["\n[bold cyan]Detailed Error Diagnostics[/bold cyan]"]
+
+        # Display extraction diagnostics
+        if "extraction_diagnostics" in error_data:
+            section.append("\n[bold cyan]Text Extraction Diagnostics[/bold cyan]")
+            extraction_diag = error_data["extraction_diagnostics"]
+            if extraction_diag:
+                # Display page count
+                section.append(f"Page count: {extraction_diag.get('page_count', 0)}")
+
+                # Display failure reason and details
+                if "failure_reason" in extraction_diag:
+                    section.append(f"[bold red]Failure reason: {extraction_diag['failure_reason']}[/bold red]")
+                    section.append(f"Failure details: {extraction_diag.get('failure_details', 'No details')}")
+
+                # Display extraction attempts
+                attempts = extraction_diag.get("extraction_attempts", [])
+                if attempts:
+                    section.append("\n[bold]Extraction attempts:[/bold]")
+                    attempts_table = Table(show_header=True, header_style="bold blue")
+                    attempts_table.add_column("Attempt")
+                    attempts_table.add_column("Encoding")
+                    attempts_table.add_column("Status")
+                    attempts_table.add_column("Notes", no_wrap=False, max_width=60)
+
+                    rows = [
+                        (
+                            str(i + 1),
+                            attempt.get("encoding", "unknown"),
+                            _OK_MARK if attempt.get("success", False) else _FAIL_MARK,
+                            attempt.get("note") or attempt.get("error", "")
+                        )
+                        for i, attempt in enumerate(attempts)
+                    ]
+                    for row in rows:
+                        attempts_table.add_row(*row)
+
+                    section.append(attempts_table)
+
+        # Display analysis diagnostics
+        if "analysis_diagnostics" in error_data:
+            section.append("\n[bold cyan]Analysis Diagnostics[/bold cyan]")
+            analysis_diag = error_data["analysis_diagnostics"]
+            if analysis_diag:
+                if "issues_found" in analysis_diag and analysis_diag["issues_found"]:
+                    section.append("[bold]Issues found:[/bold] " + ", ".join(analysis_diag["issues_found"]))
+
+                if "primary_rejection_reason" in analysis_diag:
+                    section.append("[bold]Primary rejection reason:[/bold] " +
+                                   (analysis_diag["primary_rejection_reason"] or "None"))
+
+                if "all_issues" in analysis_diag and analysis_diag["all_issues"]:
+                    section.append("\n[bold]All detected issues:[/bold]")
+                    issues_table = Table(show_header=True, header_style="bold blue")
+                    issues_table.add_column("Type")
+                    issues_table.add_column("Description", no_wrap=False, max_width=60)
+                    issues_table.add_column("Severity")
+                    issues_table.add_column("Pages")
+
+                    rows = []
+                    for issue in analysis_diag["all_issues"]:
+                        severity = issue.get("severity", "")
+                        # Severities are written lowercase; only pay for
+                        # .lower() on values that miss the first lookup
+                        severity_color = (
+                            _SEVERITY_COLOR.get(severity)
+                            or _SEVERITY_COLOR.get(severity.lower(), "white")
+                        )
+
+                        page_numbers = issue.get("page_numbers")
+                        if not page_numbers:
+                            pages = "N/A"
+                        elif isinstance(page_numbers, list):
+                            pages = ", ".join(str(p) for p in page_numbers)
+                        else:
+                            pages = str(page_numbers)
+
+                        rows.append((
+                            issue.get("type", "Unknown"),
+                            issue.get("description", "No description"),
+                            Text(severity or "Unknown", style=severity_color),
+                            pages
+                        ))
+
+                    for row in rows:
+                        issues_table.add_row(*row)
+
+                    section.append(issues_table)
+
+        console.print(Group(*section))
+
+
+# Last rendered run-stats table, keyed by the values it displays, so
+# repeated renders of unchanged stats (e.g. progress refreshes) reuse the
+# already-built Table instead of rebuilding every row
+_RUN_STATS_CACHE = {"key": None, "table": None}
 
 
 def _display_run_stats(run_stats):
     """Display run statistics in a formatted table."""
+    cache_key = (
+        run_stats.run_id,
+        run_stats.run_name,
+        run_stats.collection,
+        getattr(run_stats, 'start_time', None),
+        getattr(run_stats, 'end_time', None),
+        run_stats.status,
+        run_stats.total_files,
+        run_stats.processed_files,
+        run_stats.failed_files,
+        run_stats.skipped_files,
+        run_stats.already_processed_files,
+        run_stats.completion_percentage,
+        run_stats.chunk_size,
+        run_stats.chunk_overlap,
+    )
+    if _RUN_STATS_CACHE["key"] == cache_key:
+        console.print(_RUN_STATS_CACHE["table"])
+        return
+
     table = Table(show_header=True, header_style="bold magenta", expand=False)
     table.add_column("Property")
     table.add_column("Value", no_wrap=False)
@@ -818,11 +927,11 @@ def _display_run_stats(run_stats):
     
     # Calculate and display duration if both start and end times are available
     if hasattr(run_stats, 'start_time') and hasattr(run_stats, 'end_time') and run_stats.start_time and run_stats.end_time:
-        from datetime import datetime
         try:
-            # Parse the datetime strings
-            start_dt = datetime.fromisoformat(run_stats.start_time.replace('Z', '+00:00'))
-            end_dt = datetime.fromisoformat(run_stats.end_time.replace('Z', '+00:00'))
+            # Parse the datetime strings; fromisoformat accepts a trailing
+            # 'Z' natively on Python 3.11+, so no intermediate string is built
+            start_dt = datetime.fromisoformat(run_stats.start_time)
+            end_dt = datetime.fromisoformat(run_stats.end_time)
             
             # Calculate duration
             duration = end_dt - start_dt
@@ -853,7 +962,9 @@ def _display_run_stats(run_stats):
         table.add_row("Chunk Size", str(run_stats.chunk_size))
     if run_stats.chunk_overlap:
         table.add_row("Chunk Overlap", str(run_stats.chunk_overlap))
-    
+
+    _RUN_STATS_CACHE["key"] = cache_key
+    _RUN_STATS_CACHE["table"] = table
     console.print(table)
 
 
@@ -14,11 +14,34 @@ import json
 import os
 import sqlite3
 import datetime
-from typing import Dict, List, Optional, Any, Union, Tuple
+import threading
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Dict, Iterator, List, Optional, Any, Union, Tuple
 
 from cake_gobbler.models.db_models import IngestionRecord, RunRecord
 from cake_gobbler.models.pdf_models import PDFAnalysisResult
 
+try:
+    # orjson serializes the nested analysis payload several times faster
+    # than stdlib json; optional, with a stdlib fallback
+    import orjson
+
+    def _json_dumps(obj) -> str:
+        return orjson.dumps(obj).decode()
+except ImportError:
+    def _json_dumps(obj) -> str:
+        return json.dumps(obj)
+
+
+@lru_cache(maxsize=512)
+def _encoding_types_json(names: Tuple[str, ...]) -> str:
+    """
+    Serialize an encoding-type name tuple. Bulk ingests see the same few
+    combinations over and over, so the result is cached per tuple.
+    """
+    return _json_dumps(list(names))
+
 
 class DatabaseManager:
     """
@@ -34,7 +57,13 @@ class DatabaseManager:
         """
         self.db_path = db_path
         self.conn = None
-        self.cursor = None
+        self._in_batch = False
+        # One read-write connection guarded by a lock, plus lazily-opened
+        # per-thread read-only connections (WAL readers never block the
+        # writer), so concurrent readers don't serialize on one cursor
+        self._write_lock = threading.RLock()
+        self._read_local = threading.local()
+        self._read_conns = []
         self.init_db()
     
     def init_db(self):
@@ -44,16 +73,36 @@ class DatabaseManager:
         # Check if database file exists, if not, we need to create it from scratch
         db_exists = os.path.exists(self.db_path)
         
-        self.conn = sqlite3.connect(self.db_path)
-        self.cursor = self.conn.cursor()
-        
+        # check_same_thread is off because the ingest pipeline finalizes
+        # files on a background worker; every write is serialized through
+        # _write_lock, so the connection is never used concurrently
+        self.conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        # C-implemented rows with dict-like access; the get_* methods build
+        # plain dicts with one dict(row) call instead of zipping
+        # cursor.description per row
+        self.conn.row_factory = sqlite3.Row
+
+        # Tune the connection for the write-heavy ingestion workload: WAL
+        # avoids the double journal write and lets readers proceed during
+        # writes, synchronous=NORMAL drops the per-commit fsync (safe in
+        # WAL), and the rest keep temp data and hot pages off the disk.
+        # journal_mode persists in the database file; the others are
+        # per-connection, so they are all applied here on every open.
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.execute('PRAGMA synchronous=NORMAL')
+        self.conn.execute('PRAGMA temp_store=MEMORY')
+        self.conn.execute('PRAGMA mmap_size=268435456')
+        self.conn.execute('PRAGMA cache_size=-64000')
+        self.conn.execute('PRAGMA busy_timeout=5000')
+
+
         # If database file didn't exist or we're in a migration scenario, 
         # handle potential schema changes
         if not db_exists:
             print(f"Creating new database at {self.db_path}")
         
         # Create the runs table with extracted columns
-        self.cursor.execute('''
+        self.conn.execute('''
             CREATE TABLE IF NOT EXISTS runs (
                 run_id TEXT PRIMARY KEY,
                 start_time TEXT,
@@ -76,7 +125,7 @@ class DatabaseManager:
         ''')
         
         # Create the enhanced ingestion_log table
-        self.cursor.execute('''
+        self.conn.execute('''
             CREATE TABLE IF NOT EXISTS ingestion_log (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
                 file_path TEXT,
@@ -105,35 +154,121 @@ class DatabaseManager:
         ''')
         
         # Add index for fingerprint lookups
-        self.cursor.execute('''
+        self.conn.execute('''
             CREATE INDEX IF NOT EXISTS idx_file_fingerprint 
             ON ingestion_log(file_fingerprint)
         ''')
         
         # Add index for file path lookups
-        self.cursor.execute('''
-            CREATE INDEX IF NOT EXISTS idx_file_path 
+        self.conn.execute('''
+            CREATE INDEX IF NOT EXISTS idx_file_path
             ON ingestion_log(file_path)
         ''')
-        
+
+        # Compound index covering the per-file needs-processing probe:
+        # fingerprint equality, run membership, newest-first order
+        self.conn.execute('''
+            CREATE INDEX IF NOT EXISTS idx_fp_run_id
+            ON ingestion_log(file_fingerprint, run_id, id DESC)
+        ''')
+
+        # Lets the collection filter on runs resolve to run_ids in the index
+        self.conn.execute('''
+            CREATE INDEX IF NOT EXISTS idx_runs_collection
+            ON runs(collection, run_id)
+        ''')
+
+
         self.conn.commit()
         
-    def log_ingestion(self, file_path: str, collection: str, status: str, analysis_result=None, error_message: str = "", 
-                   issues: str = "", run_id: str = None, file_fingerprint: str = None):
+    @contextmanager
+    def batch(self, rollback_on_error: bool = True):
         """
-        Log an ingestion attempt with detailed analysis results.
-        
-        Args:
-            file_path: Path to the PDF file
-            status: Status of the ingestion (success, error, skipped)
-            analysis_result: PDFAnalysisResult object from the analyzer
-            error_message: Error message if any
-            issues: JSON string of issues if any
-            run_id: Optional run ID to associate with this ingestion
-            file_fingerprint: Unique fingerprint of the file for tracking changes
+        Group the writes issued inside the context into one transaction.
+
+        While the context is active, the per-call commits in the write
+        methods are skipped; everything is committed once on exit. If the
+        block raises, the transaction is rolled back — or committed when
+        rollback_on_error is False, for callers whose writes record work
+        that really happened and must not be discarded on failure. Use
+        checkpoint() inside long batches to bound what a hard crash loses.
+
+        The lock is held only around the transaction boundaries, not the
+        body, so writes issued by the pipeline's finalize worker while the
+        batch is open simply join the transaction.
+        """
+        with self._write_lock:
+            self.conn.execute('BEGIN IMMEDIATE')
+            self._in_batch = True
+        try:
+            yield self
+        except BaseException:
+            # BaseException so an interrupt (KeyboardInterrupt/SystemExit)
+            # cannot strand an open transaction with _in_batch still set
+            with self._write_lock:
+                self._in_batch = False
+                if rollback_on_error:
+                    self.conn.rollback()
+                else:
+                    self.conn.commit()
+            raise
+        else:
+            with self._write_lock:
+                self._in_batch = False
+                self.conn.commit()
+        finally:
+            self._in_batch = False
+
+    def checkpoint(self) -> None:
+        """
+        Commit the open batch transaction and immediately begin a new one,
+        so the work recorded so far survives a later failure or crash.
+        No-op outside a batch.
+        """
+        if not self._in_batch:
+            return
+        with self._write_lock:
+            self.conn.commit()
+            self.conn.execute('BEGIN IMMEDIATE')
+
+    def _commit(self):
+        """Commit now, unless a batch transaction is active."""
+        if not self._in_batch:
+            self.conn.commit()
+
+    def _read_conn(self) -> sqlite3.Connection:
+        """
+        Return this thread's read-only connection, opening it on first use.
+
+        Readers see the last committed state; under WAL they proceed
+        without blocking (or being blocked by) the writer.
+        """
+        conn = getattr(self._read_local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(f'file:{self.db_path}?mode=ro', uri=True)
+            conn.row_factory = sqlite3.Row
+            conn.execute('PRAGMA busy_timeout=5000')
+            self._read_local.conn = conn
+            self._read_conns.append(conn)
+        return conn
+
+    _INSERT_INGESTION_SQL = '''
+        INSERT INTO ingestion_log (
+            file_path, collection, status, error_message, issues, ingestion_time,
+            encoding_types, is_encrypted, is_damaged, num_pages, filesize,
+            analysis_result, run_id, file_fingerprint
+        )
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    '''
+
+    def _build_ingestion_row(self, file_path: str, collection: str, status: str, analysis_result=None,
+                             error_message: str = "", issues: str = "", run_id: str = None,
+                             file_fingerprint: str = None) -> Tuple:
+        """
+        Build the parameter tuple for one ingestion_log INSERT.
         """
         timestamp = datetime.datetime.now().isoformat()
-        
+
         # Default values for analysis fields
         encoding_types = None
         is_encrypted = 0
@@ -141,86 +276,110 @@ class DatabaseManager:
         num_pages = 0
         filesize = 0
         analysis_json = None
-        
+
         # If analysis_result is provided, extract the detailed information
         if analysis_result:
-            # Convert encoding types enum to strings
-            encoding_types_list = [et.name for et in analysis_result.encoding_types] if analysis_result.encoding_types else []
-            encoding_types = json.dumps(encoding_types_list)
-            
+            # The model builds its own serializable form; reuse its
+            # encoding-type list instead of re-walking the enum set here
+            analysis_dict = analysis_result.to_json_dict()
+            encoding_types = _encoding_types_json(tuple(analysis_dict["encoding_types"]))
+
             # Convert boolean to integer for SQLite
             is_encrypted = 1 if analysis_result.is_encrypted else 0
             is_damaged = 1 if analysis_result.is_damaged else 0
-            
+
             # Basic file info
             num_pages = analysis_result.num_pages
             filesize = analysis_result.filesize
-            
-            # Convert the entire analysis result to JSON
-            # We need to create a serializable dict from the analysis_result
-            analysis_dict = {
-                "filepath": str(analysis_result.filepath),
-                "filesize": analysis_result.filesize,
-                "num_pages": analysis_result.num_pages,
-                "is_encrypted": analysis_result.is_encrypted,
-                "is_damaged": analysis_result.is_damaged,
-                "encoding_types": encoding_types_list,
-                "issues": [
-                    {
-                        "type": issue.type.name,
-                        "description": issue.description,
-                        "severity": issue.severity,
-                        "page_numbers": issue.page_numbers,
-                        "details": issue.details
-                    }
-                    for issue in analysis_result.issues
-                ],
-                "metadata": analysis_result.metadata
-            }
-            analysis_json = json.dumps(analysis_dict)
-        
-        # Insert the record with all the detailed information
-        self.cursor.execute('''
-            INSERT INTO ingestion_log (
-                file_path, collection, status, error_message, issues, ingestion_time,
-                encoding_types, is_encrypted, is_damaged, num_pages, filesize,
-                analysis_result, run_id, file_fingerprint
-            )
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        ''', (
+
+            analysis_json = _json_dumps(analysis_dict)
+
+        return (
             file_path, collection, status, error_message, issues, timestamp,
             encoding_types, is_encrypted, is_damaged, num_pages, filesize,
             analysis_json, run_id, file_fingerprint
-        ))
-        
-        # Commit the transaction
-        self.conn.commit()
-    
+        )
+
+    def log_ingestion(self, file_path: str, collection: str, status: str, analysis_result=None, error_message: str = "",
+                   issues: str = "", run_id: str = None, file_fingerprint: str = None):
+        """
+        Log an ingestion attempt with detailed analysis results.
+
+        Args:
+            file_path: Path to the PDF file
+            status: Status of the ingestion (success, error, skipped)
+            analysis_result: PDFAnalysisResult object from the analyzer
+            error_message: Error message if any
+            issues: JSON string of issues if any
+            run_id: Optional run ID to associate with this ingestion
+            file_fingerprint: Unique fingerprint of the file for tracking changes
+        """
+        # Insert the record with all the detailed information
+        with self._write_lock:
+            self.conn.execute(self._INSERT_INGESTION_SQL, self._build_ingestion_row(
+                file_path, collection, status, analysis_result, error_message,
+                issues, run_id, file_fingerprint
+            ))
+
+            # Commit the transaction
+            self._commit()
+
+
     def get_ingestion_log(self, limit: int = 100) -> List[Dict[str, Any]]:
         """
         Get the most recent ingestion log entries.
-        
+
         Args:
             limit: Maximum number of entries to return
-            
+
         Returns:
             List of dictionaries containing the log entries
         """
-        self.cursor.execute('''
+        return list(self.iter_ingestion_log(limit=limit))
+
+    def iter_ingestion_log(self, limit: int = 100) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over the most recent ingestion log entries without
+        materializing them all at once.
+
+        Args:
+            limit: Maximum number of entries to yield
+
+        Yields:
+            Dictionaries containing the log entries
+        """
+        cursor = self._read_conn().execute('''
             SELECT * FROM ingestion_log
             ORDER BY id DESC
             LIMIT ?
         ''', (limit,))
-        
-        columns = [column[0] for column in self.cursor.description]
-        results = []
-        
-        for row in self.cursor.fetchall():
-            result = dict(zip(columns, row))
-            results.append(result)
-        
-        return results
+
+        while rows := cursor.fetchmany(256):
+            for row in rows:
+                yield dict(row)
     
+    def get_ingestion_by_id(self, ingestion_id: int) -> Optional[Dict[str, Any]]:
+        """
+        Get a specific ingestion log entry by its primary key.
+
+        Args:
+            ingestion_id: ID of the ingestion record
+
+        Returns:
+            Dictionary containing the log entry or None if not found
+        """
+        cursor = self._read_conn().execute('''
+            SELECT * FROM ingestion_log
+            WHERE id = ?
+            LIMIT 1
+        ''', (ingestion_id,))
+
+        row = cursor.fetchone()
+        if not row:
+            return None
+
+        return dict(row)
+
     def get_ingestion_by_file(self, file_path: str, collection_name: str = None) -> Optional[Dict[str, Any]]:
         """
         Get the most recent ingestion log entry for a specific file and collection.
@@ -234,7 +393,7 @@ class DatabaseManager:
         """
         if collection_name is None:
             # If no collection specified, just return the most recent entry for this file
-            self.cursor.execute('''
+            cursor = self._read_conn().execute('''
                 SELECT * FROM ingestion_log
                 WHERE file_path = ?
                 ORDER BY id DESC
@@ -242,7 +401,7 @@ class DatabaseManager:
             ''', (file_path,))
         else:
             # If collection is specified, join with runs table to check collection
-            self.cursor.execute('''
+            cursor = self._read_conn().execute('''
                 SELECT il.* FROM ingestion_log il
                 JOIN runs r ON il.run_id = r.run_id
                 WHERE il.file_path = ?
@@ -250,13 +409,12 @@ class DatabaseManager:
                 ORDER BY il.id DESC
                 LIMIT 1
             ''', (file_path, collection_name))
-        
-        row = self.cursor.fetchone()
+
+        row = cursor.fetchone()
         if not row:
             return None
         
-        columns = [column[0] for column in self.cursor.description]
-        return dict(zip(columns, row))
+        return dict(row)
     
     def get_files_with_encoding_type(self, encoding_type: str) -> List[Dict[str, Any]]:
         """
@@ -268,23 +426,19 @@ class DatabaseManager:
         Returns:
             List of dictionaries containing the log entries
         """
-        # We need to search for the encoding type in the JSON array
-        search_pattern = f'%"{encoding_type}"%'
-        
-        self.cursor.execute('''
+        # Match the exact value in the JSON array via json_each instead of
+        # an unanchored LIKE, which also hit substrings of other values
+        cursor = self._read_conn().execute('''
             SELECT * FROM ingestion_log
-            WHERE encoding_types LIKE ?
+            WHERE encoding_types IS NOT NULL
+            AND EXISTS (
+                SELECT 1 FROM json_each(ingestion_log.encoding_types)
+                WHERE json_each.value = ?
+            )
             ORDER BY id DESC
-        ''', (search_pattern,))
-        
-        columns = [column[0] for column in self.cursor.description]
-        results = []
-        
-        for row in self.cursor.fetchall():
-            result = dict(zip(columns, row))
-            results.append(result)
-        
-        return results
+        ''', (encoding_type,))
+
+        return [dict(row) for row in cursor.fetchall()]
     
     def get_files_with_font_type(self, font_type: str) -> List[Dict[str, Any]]:
         """
@@ -296,23 +450,19 @@ class DatabaseManager:
         Returns:
             List of dictionaries containing the log entries
         """
-        # We need to search for the font type in the JSON array
-        search_pattern = f'%"type": "{font_type}"%'
-        
-        self.cursor.execute('''
+        # Match against the fonts array of the analysis payload; records
+        # without one simply don't match
+        cursor = self._read_conn().execute('''
             SELECT * FROM ingestion_log
-            WHERE fonts LIKE ?
+            WHERE analysis_result IS NOT NULL
+            AND EXISTS (
+                SELECT 1 FROM json_each(ingestion_log.analysis_result, '$.fonts')
+                WHERE json_each.value ->> '$.type' = ?
+            )
             ORDER BY id DESC
-        ''', (search_pattern,))
-        
-        columns = [column[0] for column in self.cursor.description]
-        results = []
-        
-        for row in self.cursor.fetchall():
-            result = dict(zip(columns, row))
-            results.append(result)
-        
-        return results
+        ''', (font_type,))
+
+        return [dict(row) for row in cursor.fetchall()]
     
     def get_files_with_issue_type(self, issue_type: str) -> List[Dict[str, Any]]:
         """
@@ -324,25 +474,31 @@ class DatabaseManager:
         Returns:
             List of dictionaries containing the log entries
         """
-        # We need to search for the issue type in the JSON array
-        search_pattern = f'%"type": "{issue_type}"%'
-        
-        self.cursor.execute('''
+        # Match the issue type exactly inside the issues array; the old
+        # unanchored LIKE also matched the substring in issue descriptions
+        cursor = self._read_conn().execute('''
             SELECT * FROM ingestion_log
-            WHERE analysis_result LIKE ?
+            WHERE analysis_result IS NOT NULL
+            AND EXISTS (
+                SELECT 1 FROM json_each(ingestion_log.analysis_result, '$.issues')
+                WHERE json_each.value ->> '$.type' = ?
+            )
             ORDER BY id DESC
-        ''', (search_pattern,))
-        
-        columns = [column[0] for column in self.cursor.description]
-        results = []
-        
-        for row in self.cursor.fetchall():
-            result = dict(zip(columns, row))
-            results.append(result)
-        
-        return results
+        ''', (issue_type,))
+
+        return [dict(row) for row in cursor.fetchall()]
     
-    def create_run(self, run_id: str, start_time: str, total_files: int = 0, 
+    _INSERT_RUN_SQL = '''
+        INSERT INTO runs (
+            run_id, start_time, status, total_files,
+            processed_files, failed_files, skipped_files, already_processed_files,
+            run_name, collection, embedding_model,
+            chunk_size, chunk_overlap
+        )
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    '''
+
+    def create_run(self, run_id: str, start_time: str, total_files: int = 0,
                  run_record: RunRecord = None, metadata: Dict[str, Any] = None) -> None:
         """
         Create a new run record in the database.
@@ -380,22 +536,32 @@ class DatabaseManager:
                 chunk_size = cmd_args.get("chunk_size")
                 chunk_overlap = cmd_args.get("chunk_overlap")
         
-        self.cursor.execute('''
-            INSERT INTO runs (
-                run_id, start_time, status, total_files,
-                processed_files, failed_files, skipped_files, already_processed_files,
+        with self._write_lock:
+            self.conn.execute(self._INSERT_RUN_SQL, (
+                run_id, start_time, "running", total_files,
+                0, 0, 0, 0,
                 run_name, collection, embedding_model,
                 chunk_size, chunk_overlap
-            )
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        ''', (
-            run_id, start_time, "running", total_files,
-            0, 0, 0, 0,
-            run_name, collection, embedding_model,
-            chunk_size, chunk_overlap
-        ))
-        self.conn.commit()
+            ))
+            self._commit()
     
+    _UPDATE_RUN_SQL = '''
+        UPDATE runs SET
+            end_time = COALESCE(?, end_time),
+            status = COALESCE(?, status),
+            processed_files = COALESCE(?, processed_files),
+            failed_files = COALESCE(?, failed_files),
+            skipped_files = COALESCE(?, skipped_files),
+            already_processed_files = COALESCE(?, already_processed_files),
+            total_processing_time = COALESCE(?, total_processing_time),
+            run_name = COALESCE(?, run_name),
+            collection = COALESCE(?, collection),
+            embedding_model = COALESCE(?, embedding_model),
+            chunk_size = COALESCE(?, chunk_size),
+            chunk_overlap = COALESCE(?, chunk_overlap)
+        WHERE run_id = ?
+    '''
+
     def update_run(self, run_id: str, end_time: str = None, status: str = None,
                   processed_files: int = None, failed_files: int = None,
                   skipped_files: int = None, already_processed_files: int = None,
@@ -416,101 +582,50 @@ class DatabaseManager:
             run_record: RunRecord object with fields to update
             metadata: Dictionary of metadata to extract values from
         """
-        # Build the SET clause and parameters dynamically based on provided values
-        set_clauses = []
-        params = []
-        
-        if end_time is not None:
-            set_clauses.append("end_time = ?")
-            params.append(end_time)
-        
-        if status is not None:
-            set_clauses.append("status = ?")
-            params.append(status)
-        
-        if processed_files is not None:
-            set_clauses.append("processed_files = ?")
-            params.append(processed_files)
-        
-        if failed_files is not None:
-            set_clauses.append("failed_files = ?")
-            params.append(failed_files)
-        
-        if skipped_files is not None:
-            set_clauses.append("skipped_files = ?")
-            params.append(skipped_files)
-            
-        if already_processed_files is not None:
-            set_clauses.append("already_processed_files = ?")
-            params.append(already_processed_files)
-        
-        if total_processing_time is not None:
-            set_clauses.append("total_processing_time = ?")
-            params.append(total_processing_time)
-        
-        # Update specific metadata fields from the run_record
+        # Collect the optional metadata fields; None leaves a column as-is
+        run_name = None
+        collection = None
+        embedding_model = None
+        chunk_size = None
+        chunk_overlap = None
+
         if run_record:
-            if run_record.run_name is not None:
-                set_clauses.append("run_name = ?")
-                params.append(run_record.run_name)
-            
-            if run_record.collection is not None:
-                set_clauses.append("collection = ?")
-                params.append(run_record.collection)
-                
-            if run_record.embedding_model is not None:
-                set_clauses.append("embedding_model = ?")
-                params.append(run_record.embedding_model)
-                
-            if run_record.chunk_size is not None:
-                set_clauses.append("chunk_size = ?")
-                params.append(run_record.chunk_size)
-                
-            if run_record.chunk_overlap is not None:
-                set_clauses.append("chunk_overlap = ?")
-                params.append(run_record.chunk_overlap)
-        
-        # If metadata dictionary is provided, extract fields and update them
+            run_name = run_record.run_name
+            collection = run_record.collection
+            embedding_model = run_record.embedding_model
+            chunk_size = run_record.chunk_size
+            chunk_overlap = run_record.chunk_overlap
         elif metadata is not None:
-            # Update run_name if present
-            if "run_name" in metadata:
-                set_clauses.append("run_name = ?")
-                params.append(metadata["run_name"])
-            
+            run_name = metadata.get("run_name")
+
             # Extract command line args
             cmd_args = metadata.get("command_line_args", {})
             if cmd_args:
-                if "collection" in cmd_args:
-                    set_clauses.append("collection = ?")
-                    params.append(cmd_args["collection"])
-                    
-                if "embedding_model" in cmd_args:
-                    set_clauses.append("embedding_model = ?")
-                    params.append(cmd_args["embedding_model"])
-                    
-                if "chunk_size" in cmd_args:
-                    set_clauses.append("chunk_size = ?")
-                    params.append(cmd_args["chunk_size"])
-                    
-                if "chunk_overlap" in cmd_args:
-                    set_clauses.append("chunk_overlap = ?")
-                    params.append(cmd_args["chunk_overlap"])
-                    
+                collection = cmd_args.get("collection")
+                embedding_model = cmd_args.get("embedding_model")
+                chunk_size = cmd_args.get("chunk_size")
+                chunk_overlap = cmd_args.get("chunk_overlap")
+
             # Handle already_processed_files
-            if "already_processed_files" in metadata and already_processed_files is None:
-                set_clauses.append("already_processed_files = ?")
-                params.append(metadata["already_processed_files"])
-        
+            if already_processed_files is None:
+                already_processed_files = metadata.get("already_processed_files")
+
+        params = (
+            end_time, status, processed_files, failed_files, skipped_files,
+            already_processed_files, total_processing_time,
+            run_name, collection, embedding_model, chunk_size, chunk_overlap
+        )
+
         # If no parameters were provided, return early
-        if not set_clauses:
+        if all(param is None for param in params):
             return
-        
-        # Build and execute the SQL query
-        query = f"UPDATE runs SET {', '.join(set_clauses)} WHERE run_id = ?"
-        params.append(run_id)
-        
-        self.cursor.execute(query, params)
-        self.conn.commit()
+
+        # One fixed statement with COALESCE(?, col) per column: None passes
+        # the stored value through, and SQLite's prepared-statement cache
+        # gets the exact same SQL text on every progress update
+        with self._write_lock:
+            self.conn.execute(self._UPDATE_RUN_SQL, (*params, run_id))
+            self._commit()
     
     def get_run(self, run_id: str) -> Optional[Dict[str, Any]]:
         """
@@ -522,17 +637,16 @@ class DatabaseManager:
         Returns:
             Dict[str, Any]: Run record or None if not found
         """
-        self.cursor.execute('''
+        cursor = self._read_conn().execute('''
             SELECT * FROM runs
             WHERE run_id = ?
         ''', (run_id,))
-        
-        row = self.cursor.fetchone()
+
+        row = cursor.fetchone()
         if not row:
             return None
         
-        columns = [column[0] for column in self.cursor.description]
-        return dict(zip(columns, row))
+        return dict(row)
         
     def get_run_record(self, run_id: str) -> Optional[RunRecord]:
         """
@@ -581,20 +695,27 @@ class DatabaseManager:
         Returns:
             List[Dict[str, Any]]: List of run records
         """
-        self.cursor.execute('''
+        return list(self.iter_runs(limit=limit))
+
+    def iter_runs(self, limit: int = 100) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over run records without materializing them all at once.
+
+        Args:
+            limit: Maximum number of records to yield
+
+        Yields:
+            Run record dictionaries, most recent first
+        """
+        cursor = self._read_conn().execute('''
             SELECT * FROM runs
             ORDER BY start_time DESC
             LIMIT ?
         ''', (limit,))
-        
-        columns = [column[0] for column in self.cursor.description]
-        results = []
-        
-        for row in self.cursor.fetchall():
-            result = dict(zip(columns, row))
-            results.append(result)
-        
-        return results
+
+        while rows := cursor.fetchmany(256):
+            for row in rows:
+                yield dict(row)
     
     def get_ingestions_for_run(self, run_id: str) -> List[Dict[str, Any]]:
         """
@@ -606,20 +727,28 @@ class DatabaseManager:
         Returns:
             List[Dict[str, Any]]: List of ingestion records
         """
-        self.cursor.execute('''
+        return list(self.iter_ingestions_for_run(run_id))
+
+    def iter_ingestions_for_run(self, run_id: str) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over the ingestion records for a specific run without
+        materializing them all at once.
+
+        Args:
+            run_id: Unique identifier for the run
+
+        Yields:
+            Ingestion record dictionaries, oldest first
+        """
+        cursor = self._read_conn().execute('''
             SELECT * FROM ingestion_log
             WHERE run_id = ?
             ORDER BY ingestion_time ASC
         ''', (run_id,))
-        
-        columns = [column[0] for column in self.cursor.description]
-        results = []
-        
-        for row in self.cursor.fetchall():
-            result = dict(zip(columns, row))
-            results.append(result)
-        
-        return results
+
+        while rows := cursor.fetchmany(256):
+            for row in rows:
+                yield dict(row)
     
     def get_ingestion_by_fingerprint(self, file_fingerprint: str, collection_name: str) -> Optional[Dict[str, Any]]:
         """
@@ -632,82 +761,158 @@ class DatabaseManager:
         Returns:
             Dictionary containing the log entry or None if not found
         """
-        # Join with runs table to check collection
-        self.cursor.execute('''
+        # The collection filter is pushed into a subquery on runs so the
+        # outer probe is satisfied by the (file_fingerprint, run_id, id)
+        # index without heap-fetching and sorting every fingerprint match
+        cursor = self._read_conn().execute('''
             SELECT il.* FROM ingestion_log il
-            JOIN runs r ON il.run_id = r.run_id
             WHERE il.file_fingerprint = ?
-            AND r.collection = ?
+            AND il.run_id IN (SELECT run_id FROM runs WHERE collection = ?)
             ORDER BY il.id DESC
             LIMIT 1
         ''', (file_fingerprint, collection_name))
-        
-        row = self.cursor.fetchone()
+
+        row = cursor.fetchone()
         if not row:
             return None
         
-        columns = [column[0] for column in self.cursor.description]
-        return dict(zip(columns, row))
+        return dict(row)
     
+    def get_known_fingerprints(self, collection_name: str, fingerprints: List[str]) -> set:
+        """
+        Return the subset of fingerprints already ingested for a collection.
+
+        One query per chunk of fingerprints, instead of a probe per file.
+
+        Args:
+            collection_name: The Weaviate collection name
+            fingerprints: Candidate file fingerprints
+
+        Returns:
+            Set of fingerprints that have an ingestion record
+        """
+        known = set()
+        # Stay under SQLite's bound-parameter limit
+        for start in range(0, len(fingerprints), 500):
+            batch = fingerprints[start:start + 500]
+            placeholders = ", ".join("?" for _ in batch)
+            cursor = self._read_conn().execute(f'''
+                SELECT DISTINCT il.file_fingerprint FROM ingestion_log il
+                WHERE il.file_fingerprint IN ({placeholders})
+                AND il.run_id IN (SELECT run_id FROM runs WHERE collection = ?)
+            ''', (*batch, collection_name))
+            known.update(row[0] for row in cursor.fetchall())
+        return known
+
+    def file_already_processed(self, file_fingerprint: str, collection_name: str) -> bool:
+        """
+        Check whether a file fingerprint was already ingested for a collection.
+
+        This only probes for existence (SELECT 1 ... LIMIT 1), so the large
+        analysis_result blob is never read. Note: this does not check
+        whether the previous ingestion was successful, only that the file
+        was ingested.
+
+        Args:
+            file_fingerprint: Unique fingerprint of the file
+            collection_name: The Weaviate collection name for this ingestion
+
+        Returns:
+            bool: True if an ingestion record exists
+        """
+        cursor = self._read_conn().execute('''
+            SELECT 1 FROM ingestion_log il
+            WHERE il.file_fingerprint = ?
+            AND il.run_id IN (SELECT run_id FROM runs WHERE collection = ?)
+            LIMIT 1
+        ''', (file_fingerprint, collection_name))
+
+        return cursor.fetchone() is not None
+
     def file_needs_processing(self, file_fingerprint: str, collection_name: str) -> Tuple[bool, Optional[Dict[str, Any]]]:
         """
         Determine if a file needs processing based on its fingerprint and collection name.
-        
+
         Args:
             file_path: Path to the file
             file_fingerprint: Unique fingerprint of the file
             collection_name: The Weaviate collection name for this ingestion
-            
+
         Returns:
-            Tuple[bool, Optional[Dict[str, Any]]]: 
+            Tuple[bool, Optional[Dict[str, Any]]]:
                 - Boolean indicating if the file needs processing
                 - Previous ingestion record if it exists, otherwise None
         """
-        # First try to find by fingerprint and collection
-        previous_ingestion = self.get_ingestion_by_fingerprint(file_fingerprint, collection_name)
-        
-        # If found, no need to process again for this collection. Note: this does not check to see if the status was successful, only that the file was ingested.
-        if previous_ingestion:
-            return False, previous_ingestion
-        else:
+        # Cheap existence probe first; only fetch the full previous record
+        # (with its analysis blob) when one actually exists
+        if not self.file_already_processed(file_fingerprint, collection_name):
             return True, None
+
+        return False, self.get_ingestion_by_fingerprint(file_fingerprint, collection_name)
         
     def close(self):
         """
         Close the database connection.
         """
-        if self.cursor:
-            self.cursor.close()
-            self.cursor = None
-            
         if self.conn:
+            # Let SQLite refresh its query-planner statistics before closing
+            try:
+                self.conn.execute('PRAGMA optimize')
+            except sqlite3.Error:
+                pass
             self.conn.close()
             self.conn = None
 
+        # Close any read-only connections opened by reader threads
+        for conn in self._read_conns:
+            try:
+                conn.close()
+            except sqlite3.Error:
+                pass
+        self._read_conns.clear()
+        self._read_local = threading.local()
+
     def get_all_records(self, collection_name: str) -> List[Dict[str, Any]]:
         """
         Get all records for a specific collection.
         """
-        self.cursor.execute('''
+        cursor = self._read_conn().execute('''
             SELECT * FROM ingestion_log
             WHERE collection = ?
         ''', (collection_name,))
-        
-        columns = [column[0] for column in self.cursor.description]
-        results = []
-        
-        for row in self.cursor.fetchall():
-            result = dict(zip(columns, row))
-            results.append(result)
-        
-        return results
+
+        return [dict(row) for row in cursor.fetchall()]
     
     def delete_record(self, collection_name: str, file_path: str) -> None:
         """
         Delete a record from the database.
         """
-        self.cursor.execute('''
-            DELETE FROM ingestion_log
-            WHERE collection = ? AND file_path = ?
-        ''', (collection_name, file_path))
-        self.conn.commit()
+        with self._write_lock:
+            self.conn.execute('''
+                DELETE FROM ingestion_log
+                WHERE collection = ? AND file_path = ?
+            ''', (collection_name, file_path))
+            self._commit()
+
+    def delete_records_bulk(self, collection_name: str, file_paths: List[str]) -> None:
+        """
+        Delete records for multiple file paths with chunked IN statements.
+
+        Args:
+            collection_name: The collection the records belong to
+            file_paths: File paths whose records should be removed
+        """
+        if not file_paths:
+            return
+
+        with self._write_lock:
+            # Stay under SQLite's bound-parameter limit, as the fingerprint
+            # prefilter does
+            for start in range(0, len(file_paths), 500):
+                batch = file_paths[start:start + 500]
+                placeholders = ", ".join("?" for _ in batch)
+                self.conn.execute(f'''
+                    DELETE FROM ingestion_log
+                    WHERE collection = ? AND file_path IN ({placeholders})
+                ''', (collection_name, *batch))
+            self._commit()
@@ -12,23 +12,61 @@ analyzing, extracting text, chunking, embedding, and storing in Weaviate.
 import json
 import os
 import logging
-from typing import List
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Iterator, List, Optional, Tuple
 
 from cake_gobbler.models.config import AppConfig
 from cake_gobbler.core.pdf_processor import PDFProcessor
 
 from cake_gobbler.core.db_manager import DatabaseManager
 from cake_gobbler.core.run_manager import RunManager
-from cake_gobbler.core.weaviate_manager import WeaviateManager
+from cake_gobbler.core.weaviate_manager import get_weaviate_manager
 from cake_gobbler.core.embedding_model_manager import EmbeddingModelManager
 from cake_gobbler.utils.file_utils import calculate_file_fingerprint
+import numpy as np
 import ray
 
+try:
+    # orjson keeps the per-file diagnostics serialization off the critical
+    # path's profile; optional, with a stdlib fallback
+    import orjson
+
+    def _json_dumps(obj) -> str:
+        return orjson.dumps(obj).decode()
+except ImportError:
+    def _json_dumps(obj) -> str:
+        return json.dumps(obj)
+
+
+@dataclass(slots=True)
+class PreparedFile:
+    """
+    Result of the local (CPU-bound) preparation stage of an ingestion.
+
+    Holds everything needed to finish ingesting a file once its embeddings
+    are available. If preparation already resolved the file (skipped, error,
+    already processed), ``status`` is set and no further work is required.
+    """
+    pdf_path: str
+    file_fingerprint: Optional[str] = None
+    status: Optional[str] = None
+    chunks: List[str] = field(default_factory=list)
+    metadata: dict = field(default_factory=dict)
+    analysis_result: Any = None
+
+
 class IngestionManager:
     """
     Manages the PDF ingestion process end-to-end.
     """
-    
+
+    # Don't shard fewer chunks than this across actors: each remote batch
+    # pays Ray scheduling plus object-store serialization, which dwarfs the
+    # encode time for tiny batches
+    MIN_EMBED_BATCH = 32
+
     def __init__(self, app_config: AppConfig):
         """
         Initialize the ingestion manager.
@@ -54,11 +92,18 @@ class IngestionManager:
             chunk_overlap=app_config.processing.chunk_overlap,
             verbose=app_config.verbose
         )
-        self.weaviate_manager = WeaviateManager(app_config.weaviate)
+        self.weaviate_manager = get_weaviate_manager(app_config.weaviate)
 
         self._embedding_model_managers = None
+        self._collection = None  # Cached Weaviate collection handle
         self.run_manager = None  # Will be initialized when embedding managers are created
 
+        # Single worker that collects embeddings and writes to
+        # Weaviate/SQLite off the driver thread, so the driver can keep
+        # parsing the next file while gRPC stores run. One worker keeps the
+        # log/counter writes strictly ordered.
+        self._finalize_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="gobbler-finalize")
+
     def get_run_manager(self) -> RunManager:
         """
         Lazy load run manager.
@@ -132,47 +177,180 @@ class IngestionManager:
             refs.append(embedding_model_manager.load_embedding_model.remote(self.config.processing.embedding_model))
         ray.get(refs)
         self.logger.info(f"Embedding model loaded in {self.config.processing.ray_workers} workers.")
-        
+
+        # Resolve the collection once up front; per-file ingestion reuses
+        # the cached handle instead of re-checking the schema every file
+        self._get_collection()
+
         return run_id
     
     def end_run(self):
         """End the current ingestion run."""
         if self.run_manager is not None:
             return self.run_manager.end_run()
+
+    def _get_collection(self) -> Any:
+        """
+        Get the Weaviate collection for this ingestion, connecting and
+        creating/resolving it on first use and reusing the handle after.
+        """
+        if self._collection is None:
+            self.weaviate_manager.connect()
+            self._collection = self.weaviate_manager.create_or_get_collection(
+                self.config.collection
+            )
+        return self._collection
     
     def ingest_file(self, pdf_path: str) -> str:
         """
         Ingest a PDF file: analyze, process if acceptable, and log results.
-        
+
         Args:
             pdf_path: Path to the PDF file
-            
+
         Returns:
             str: Status of ingestion (success, error, skipped, already_processed)
         """
+        prepared = self._prepare_file(pdf_path)
+        if prepared.status is not None:
+            return prepared.status
+
+        try:
+            embeddings = self.distribute_embeddings(prepared.chunks)
+        except Exception as e:
+            return self._record_embedding_failure(prepared, e)
+
+        return self._finalize_file(prepared, embeddings)
+
+    def ingest_files(self, pdf_files: List[str]) -> Iterator[Tuple[str, str]]:
+        """
+        Ingest a sequence of PDF files, pipelining local work with embedding.
+
+        While chunks are being embedded on the remote workers, subsequent
+        files are analyzed, extracted, and chunked locally so the embedding
+        actors are not left idle between files. Up to ray_workers files may
+        have embeddings in flight at once; statuses are yielded in input
+        order as each file completes.
+
+        Args:
+            pdf_files: Paths to the PDF files to ingest
+
+        Yields:
+            Tuple[str, str]: (pdf_path, status) for each file, in input order
+        """
+        # Bound how many files may have embeddings in flight at once, so
+        # latency-bound Weaviate/embedding calls overlap with local chunking
+        # without queueing unbounded work on the actors.
+        window = max(1, self.config.processing.ray_workers)
+        in_flight = deque()   # (PreparedFile, list of embedding futures or None)
+        finalizing = deque()  # (pdf_path, Future[str]) on the finalize worker
+
+        # One batched DB query up front answers already-processed for every
+        # file, instead of a probe per file inside the loop
+        known_fingerprints = self._prefilter_fingerprints(pdf_files)
+
+        for pdf_path in pdf_files:
+            try:
+                prepared = self._prepare_file(pdf_path, known_fingerprints=known_fingerprints)
+            except Exception:
+                # Don't lose completed embeddings for files already in
+                # flight: store and log them before propagating, as the
+                # serial loop would have.
+                while in_flight:
+                    self._collect_and_finalize(*in_flight.popleft())
+                while finalizing:
+                    finalizing.popleft()[1].result()
+                raise
+            if prepared.status is None:
+                in_flight.append((prepared, self._submit_embeddings(prepared.chunks)))
+            else:
+                in_flight.append((prepared, None))
+
+            # Once the embedding window is full, hand the oldest file to the
+            # finalize worker; the driver moves on to parsing the next file
+            # while the store/log runs in the background.
+            if len(in_flight) > window:
+                oldest = in_flight.popleft()
+                finalizing.append((
+                    oldest[0].pdf_path,
+                    self._finalize_executor.submit(self._collect_and_finalize, *oldest)
+                ))
+
+            # Report whatever has finished, in input order; only block on
+            # the head of the queue when the finalize backlog grows past
+            # the window
+            while finalizing and (finalizing[0][1].done() or len(finalizing) > window):
+                path, future = finalizing.popleft()
+                yield path, future.result()
+
+        while in_flight:
+            oldest = in_flight.popleft()
+            finalizing.append((
+                oldest[0].pdf_path,
+                self._finalize_executor.submit(self._collect_and_finalize, *oldest)
+            ))
+        while finalizing:
+            path, future = finalizing.popleft()
+            yield path, future.result()
+
+    def _prefilter_fingerprints(self, pdf_files: List[str]) -> set:
+        """
+        Resolve which of the given files were already ingested for this
+        collection with one batched query.
+
+        Files whose fingerprint cannot be computed (e.g. vanished between
+        discovery and now) are left out; the per-file path surfaces the
+        error normally.
+        """
+        fingerprints = []
+        for pdf_path in pdf_files:
+            try:
+                fingerprints.append(calculate_file_fingerprint(pdf_path))
+            except OSError:
+                continue
+        return self.db_manager.get_known_fingerprints(self.config.collection, fingerprints)
+
+    def _prepare_file(self, pdf_path: str, known_fingerprints: Optional[set] = None) -> PreparedFile:
+        """
+        Run the local stages of an ingestion: fingerprint check, analysis,
+        text extraction, and chunking.
+
+        Args:
+            pdf_path: Path to the PDF file
+            known_fingerprints: Optional prefetched set of already-processed
+                fingerprints; when given, it replaces the per-file DB probe
+
+        Returns:
+            PreparedFile: Prepared state; ``status`` is set if the file was
+            resolved without needing embeddings (skipped, error, etc.)
+        """
         self.logger.info(f"Ingesting file: {pdf_path}")
-        
+
         # Get run_id
         run_id = self.run_manager.run_id
-        
+
         # Calculate file fingerprint
         file_fingerprint = calculate_file_fingerprint(pdf_path)
-        
-        # Check if file needs processing
+
+        # Check if file needs processing; the boolean probe avoids pulling
+        # the previous record's analysis blob, which we never use here
         if file_fingerprint:
-            needs_processing, previous_record = self.db_manager.file_needs_processing(
-                file_fingerprint,
-                self.config.collection
-            )
-             
-            if not needs_processing:
+            if known_fingerprints is not None:
+                already_processed = file_fingerprint in known_fingerprints
+            else:
+                already_processed = self.db_manager.file_already_processed(file_fingerprint, self.config.collection)
+            if already_processed:
                 self.logger.info(f"Skipping {pdf_path} - already processed successfully for collection '{self.config.collection}' (fingerprint: {file_fingerprint})")
                 self.run_manager.increment_already_processed()
-                return "already_processed"
-            
+                return PreparedFile(pdf_path, file_fingerprint, status="already_processed")
+
         # Delete any previous ingestion records for this file in weaviate
         # This is to ensure that we are not using a previously failed ingestion as a basis for the new ingestion
         # and that we are starting fresh from the current run for this file.
+        # The delete is deliberately unconditional: the SQLite log is not a
+        # reliable proxy for Weaviate state (a rolled-back run transaction
+        # leaves stored chunks with no log record), and skipping the delete
+        # on a stale view would duplicate the file's chunks.
         self.weaviate_manager.delete(self.config.collection, full_path=pdf_path)
         
         # Run analysis on the PDF file
@@ -186,7 +364,7 @@ class IngestionManager:
                 file_fingerprint=file_fingerprint
             )
             self.run_manager.increment_failed()
-            return "error"
+            return PreparedFile(pdf_path, file_fingerprint, status="error")
 
         # Check if PDF is acceptable for processing
         is_acceptable, reason, detailed_diagnostics = self.pdf_processor.is_pdf_acceptable(analysis_result)
@@ -199,13 +377,13 @@ class IngestionManager:
         if not is_acceptable:
             self.logger.error(f"PDF not acceptable: {reason}")
             # Include detailed diagnostics in the error message
-            detailed_reason = f"{reason}. Details: {json.dumps(detailed_diagnostics)}"
+            detailed_reason = f"{reason}. Details: {_json_dumps(detailed_diagnostics)}"
             self.db_manager.log_ingestion(
                 pdf_path, self.config.collection, "skipped", error_message=detailed_reason, run_id=run_id,
                 file_fingerprint=file_fingerprint
             )
             self.run_manager.increment_skipped()
-            return "skipped"
+            return PreparedFile(pdf_path, file_fingerprint, status="skipped")
 
         # If analysis passes, try processing the PDF
         try:
@@ -256,12 +434,12 @@ class IngestionManager:
                 }
                 
                 self.db_manager.log_ingestion(
-                    pdf_path, self.config.collection, "skipped", error_message=json.dumps(detailed_error), run_id=run_id,
+                    pdf_path, self.config.collection, "skipped", error_message=_json_dumps(detailed_error), run_id=run_id,
                     file_fingerprint=file_fingerprint
                 )
                 self.run_manager.increment_skipped()
-                return "skipped"
-            
+                return PreparedFile(pdf_path, file_fingerprint, status="skipped")
+
             # Split the text into chunks
             chunks = self.text_processor.split_text_into_chunks(text)
             
@@ -274,8 +452,8 @@ class IngestionManager:
                     file_fingerprint=file_fingerprint
                 )
                 self.run_manager.increment_skipped()
-                return "skipped"
-            
+                return PreparedFile(pdf_path, file_fingerprint, status="skipped")
+
             # Prepare metadata for storage
             metadata = {
                 "full_path": os.path.abspath(pdf_path),
@@ -285,95 +463,185 @@ class IngestionManager:
                 # "embedding_model": self.config.processing.embedding_model,  # not needed currently
                 # "chunk_overlap": self.config.processing.chunk_overlap,  # not needed currently
             }
-            
-            # Connect to Weaviate and get/create collection
-            self.weaviate_manager.connect()
-            collection = self.weaviate_manager.create_or_get_collection(
-                self.config.collection
+
+            return PreparedFile(
+                pdf_path,
+                file_fingerprint,
+                chunks=chunks,
+                metadata=metadata,
+                analysis_result=analysis_result
             )
-            
-            # Embed chunks using distributed embedding model managers
-            embeddings = self.distribute_embeddings(chunks)
-            
+        except Exception as e:
+            error_msg = f"Ingestion error: {str(e)}"
+            self.logger.error(error_msg)
+            self.db_manager.log_ingestion(
+                pdf_path, self.config.collection, "error", analysis_result, error_message=error_msg, run_id=run_id,
+                file_fingerprint=file_fingerprint
+            )
+            self.run_manager.increment_failed()
+            return PreparedFile(pdf_path, file_fingerprint, status="error")
+
+    def _finalize_file(self, prepared: PreparedFile, embeddings: List[List[float]]) -> str:
+        """
+        Run the remote-facing stages of an ingestion: store the chunks and
+        embeddings in Weaviate and log the result.
+
+        Args:
+            prepared: PreparedFile from _prepare_file
+            embeddings: Embeddings for the prepared chunks
+
+        Returns:
+            str: Final status of the ingestion (success or error)
+        """
+        try:
+            collection = self._get_collection()
+
             # Store chunks and embeddings in Weaviate
-            self.weaviate_manager.store_chunks(collection, chunks, embeddings, metadata)
-            
+            self.weaviate_manager.store_chunks(collection, prepared.chunks, embeddings, prepared.metadata)
+
             # Log successful ingestion
             self.db_manager.log_ingestion(
-                pdf_path, self.config.collection, "success", analysis_result, run_id=run_id,
-                file_fingerprint=file_fingerprint
+                prepared.pdf_path, self.config.collection, "success", prepared.analysis_result,
+                run_id=self.run_manager.run_id, file_fingerprint=prepared.file_fingerprint
             )
-            
+
             # Update run statistics
             self.run_manager.increment_processed()
-            
+
             self.logger.info(f"PDF ingestion completed successfully.")
             return "success"
         except Exception as e:
             error_msg = f"Ingestion error: {str(e)}"
             self.logger.error(error_msg)
             self.db_manager.log_ingestion(
-                pdf_path, self.config.collection, "error", analysis_result, error_message=error_msg, run_id=run_id,
-                file_fingerprint=file_fingerprint
+                prepared.pdf_path, self.config.collection, "error", prepared.analysis_result,
+                error_message=error_msg, run_id=self.run_manager.run_id,
+                file_fingerprint=prepared.file_fingerprint
             )
             self.run_manager.increment_failed()
             return "error"
-    
-    def distribute_embeddings(self, chunks: List[str]) -> List[List[float]]:
+
+    def _record_embedding_failure(self, prepared: PreparedFile, error: Exception) -> str:
+        """Log a failed embedding stage and update run statistics."""
+        error_msg = f"Ingestion error: {str(error)}"
+        self.logger.error(error_msg)
+        self.db_manager.log_ingestion(
+            prepared.pdf_path, self.config.collection, "error", prepared.analysis_result,
+            error_message=error_msg, run_id=self.run_manager.run_id,
+            file_fingerprint=prepared.file_fingerprint
+        )
+        self.run_manager.increment_failed()
+        return "error"
+
+    def _submit_embeddings(self, chunks: List[str]) -> List[ray.ObjectRef]:
+        """
+        Submit embedding work for a file's chunks without waiting on results.
+
+        Chunks are split into one batch per embedding model manager so the
+        work is spread across all workers.
+
+        Args:
+            chunks: List of text chunks to embed
+
+        Returns:
+            List of Ray object references, in chunk order
+        """
+        embedding_model_managers = self.get_embedding_model_managers()
+        if len(chunks) <= self.MIN_EMBED_BATCH or len(embedding_model_managers) <= 1:
+            return [embedding_model_managers[0].embed_chunks.remote(chunks)]
+
+        batch_size = max(self.MIN_EMBED_BATCH, len(chunks) // len(embedding_model_managers))
+        batches = [chunks[i:i + batch_size] for i in range(0, len(chunks), batch_size)]
+
+        return [
+            embedding_model_managers[i % len(embedding_model_managers)].embed_chunks.remote(batch)
+            for i, batch in enumerate(batches)
+        ]
+
+    def _collect_and_finalize(self, prepared: PreparedFile, embedding_refs: Optional[List[ray.ObjectRef]]) -> str:
+        """
+        Wait for a file's in-flight embeddings and finish its ingestion.
+
+        Args:
+            prepared: PreparedFile from _prepare_file
+            embedding_refs: Embedding futures from _submit_embeddings, or None
+                if preparation already resolved the file
+
+        Returns:
+            str: Final status of the ingestion
+        """
+        if embedding_refs is None:
+            return prepared.status
+
+        try:
+            batch_results = ray.get(embedding_refs)
+            embeddings = batch_results[0] if len(batch_results) == 1 else np.concatenate(batch_results)
+        except Exception as e:
+            return self._record_embedding_failure(prepared, e)
+
+        return self._finalize_file(prepared, embeddings)
+
+    def distribute_embeddings(self, chunks: List[str]) -> np.ndarray:
         """
         Distribute the embedding of chunks across all available embedding model managers.
-        
+
         Args:
             chunks: List of text chunks to embed
-            
+
         Returns:
-            List of embeddings (as lists of floats)
+            fp16 array of embeddings, one row per chunk
         """
-        # If we only have one chunk or one manager, just use the first manager
+        # Small chunk lists and single-manager setups go to one actor; the
+        # fan-out overhead isn't worth it below MIN_EMBED_BATCH
         embedding_model_managers = self.get_embedding_model_managers()
-        if len(chunks) <= 1 or len(embedding_model_managers) <= 1:
+        if len(chunks) <= self.MIN_EMBED_BATCH or len(embedding_model_managers) <= 1:
             return ray.get(embedding_model_managers[0].embed_chunks.remote(chunks))
-        
+
         # Split chunks into smaller batches
-        batch_size = max(1, len(chunks) // len(embedding_model_managers))
+        batch_size = max(self.MIN_EMBED_BATCH, len(chunks) // len(embedding_model_managers))
         batches = [chunks[i:i + batch_size] for i in range(0, len(chunks), batch_size)]
-        
-        # Dictionary mapping an actor to its current task (a future)
-        actor_tasks = {}
-        results = []
-        
+
+        # Futures keyed by object ref, carrying the owning actor and the
+        # batch position so results land in input order regardless of which
+        # actor finishes first
+        in_flight = {}
+        results = [None] * len(batches)
+
         # Submit the initial tasks to each actor
         for i, actor in enumerate(embedding_model_managers):
             if i < len(batches):
-                actor_tasks[actor] = actor.embed_chunks.remote(batches[i])
-        
+                in_flight[actor.embed_chunks.remote(batches[i])] = (actor, i)
+
         # Start processing remaining batches dynamically
-        next_batch_idx = len(embedding_model_managers)  # index of the next batch to process
-        
-        while actor_tasks:
-            # Wait for at least one actor to complete its task
-            done_task_ids, _ = ray.wait(list(actor_tasks.values()), num_returns=1)
-            
-            # Identify which actor finished its task
-            for actor, task in list(actor_tasks.items()):
-                if task in done_task_ids:
-                    # Retrieve the result from this task
-                    batch_result = ray.get(task)
-                    results.extend(batch_result)
-                    
-                    # If there are still batches to process, assign the next one
-                    if next_batch_idx < len(batches):
-                        actor_tasks[actor] = actor.embed_chunks.remote(batches[next_batch_idx])
-                        next_batch_idx += 1
-                    else:
-                        # No more batches to process for this actor
-                        del actor_tasks[actor]
-                    break
-        return results
+        next_batch_idx = min(len(embedding_model_managers), len(batches))
+
+        while in_flight:
+            # Block for one completion, then opportunistically drain every
+            # other ref that is already done so a single ray.get fetches
+            # them all in one deserialization pass
+            ray.wait(list(in_flight.keys()), num_returns=1)
+            ready, _ = ray.wait(list(in_flight.keys()), num_returns=len(in_flight), timeout=0)
+
+            for ref, batch_result in zip(ready, ray.get(ready)):
+                actor, batch_idx = in_flight.pop(ref)
+                results[batch_idx] = batch_result
+
+                # If there are still batches to process, assign the next one
+                if next_batch_idx < len(batches):
+                    in_flight[actor.embed_chunks.remote(batches[next_batch_idx])] = (actor, next_batch_idx)
+                    next_batch_idx += 1
+
+        return np.concatenate(results)
 
     def close(self):
         """Close all connections and clean up resources."""
         try:
+            # Let any in-flight finalize work drain before tearing down
+            self._finalize_executor.shutdown(wait=True)
+
+            # Drop the cached collection handle with its connection
+            self._collection = None
+
             # Close Weaviate connection
             if hasattr(self, 'weaviate_manager') and self.weaviate_manager:
                 try:
@@ -390,14 +658,6 @@ class IngestionManager:
                     self.logger.error(f"Error closing database manager: {str(e)}")
                 self.db_manager = None
             
-            # Clean up any CUDA resources
-            try:
-                import torch
-                if torch.cuda.is_available():
-                    torch.cuda.empty_cache()
-            except Exception as e:
-                self.logger.error(f"Error clearing CUDA cache: {str(e)}")
-            
             # Clean up embedding model managers
             if self._embedding_model_managers:
                 for manager in self._embedding_model_managers:
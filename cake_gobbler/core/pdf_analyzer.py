@@ -12,22 +12,24 @@ during processing.
 
 import os
 from dataclasses import dataclass, field
-from enum import Enum, auto
+from enum import IntEnum, auto
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Tuple
+from typing import Any, Dict, List, Optional, Set, Tuple
 import logging
 
-# Import pikepdf for fallback analysis
-import pikepdf
-from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
+# pikepdf (a C++ extension with a heavy import) and rich (console/terminal
+# probing) are only needed on the fallback and report paths respectively,
+# so both are imported lazily where used
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    import pikepdf
+    from rich.console import Console
 
 # Import our PyMuPDF interface instead of direct fitz import
 from cake_gobbler.utils.pymupdf_interface import PyMuPDFInterface
 
 
-class EncodingType(Enum):
+class EncodingType(IntEnum):
     """Enum representing different PDF encoding types."""
     ASCII = auto()
     UTF8 = auto()
@@ -45,7 +47,7 @@ class EncodingType(Enum):
     UNKNOWN = auto()
 
 
-class PDFIssueType(Enum):
+class PDFIssueType(IntEnum):
     """Enum representing different types of PDF issues."""
     PASSWORD_PROTECTED = auto()
     DAMAGED = auto()
@@ -66,7 +68,45 @@ class PDFIssueType(Enum):
     MIXED_ENCODINGS = auto()
 
 
-@dataclass
+# Name -> member maps; a plain dict get skips EnumMeta.__getitem__ and the
+# exception control flow for unknown names in the per-font/issue loops
+_ENCODING_BY_NAME = {member.name: member for member in EncodingType}
+_ISSUE_BY_NAME = {member.name: member for member in PDFIssueType}
+
+# Common /Encoding values -> EncodingType; an exact hit skips the
+# substring ladder, which remains as the fallback for unusual values
+_FONT_ENCODING_MAP = {
+    '/Identity-H': EncodingType.IDENTITY_H,
+    '/WinAnsiEncoding': EncodingType.WINANSI,
+    '/MacRomanEncoding': EncodingType.MACROMAN,
+}
+
+# Pre-rendered severity cells for the report's issues table
+_SEVERITY_MARKUP = {
+    "low": "[green]LOW[/green]",
+    "medium": "[yellow]MEDIUM[/yellow]",
+    "high": "[red bold]HIGH[/red bold]",
+}
+
+# Byte-order marks -> detection result, checked by prefix length
+_BOM_DISPATCH = {
+    b'\xEF\xBB\xBF': ('UTF-8', 1.0, EncodingType.UTF8_WITH_BOM),
+    b'\xFE\xFF': ('UTF-16BE', 1.0, EncodingType.UTF16BE_WITH_BOM),
+    b'\xFF\xFE': ('UTF-16LE', 1.0, EncodingType.UTF16LE_WITH_BOM),
+}
+
+# Python codec names (as reported by charset-normalizer) -> EncodingType
+_CODEC_ENCODING_MAP = {
+    'ascii': EncodingType.ASCII,
+    'utf_8': EncodingType.UTF8,
+    'utf_16_be': EncodingType.UTF16BE,
+    'utf_16_le': EncodingType.UTF16LE,
+    'latin_1': EncodingType.LATIN1,
+    'iso8859_1': EncodingType.LATIN1,
+}
+
+
+@dataclass(slots=True)
 class FontInfo:
     """Information about a font used in the PDF."""
     name: str
@@ -76,7 +116,7 @@ class FontInfo:
     subset: bool
 
 
-@dataclass
+@dataclass(slots=True)
 class PDFIssue:
     """Represents an issue found in a PDF file."""
     type: PDFIssueType
@@ -85,8 +125,25 @@ class PDFIssue:
     page_numbers: List[int] = field(default_factory=list)
     details: Dict[str, str] = field(default_factory=dict)
 
+    @classmethod
+    def from_dict(cls, issue_dict: Dict[str, Any]) -> Optional["PDFIssue"]:
+        """
+        Build an issue from the PyMuPDF interface's dict form in one
+        constructor call, or return None when the issue type is unknown.
+        """
+        issue_type = _ISSUE_BY_NAME.get(issue_dict.get("type", "UNKNOWN"))
+        if issue_type is None:
+            return None
+        return cls(
+            type=issue_type,
+            description=issue_dict.get("description", "Unknown issue"),
+            severity=issue_dict.get("severity", "medium"),
+            page_numbers=issue_dict.get("page_numbers", []),
+            details=issue_dict.get("details", {})
+        )
+
 
-@dataclass
+@dataclass(slots=True)
 class PDFAnalysisResult:
     """Results of a PDF encoding and structure analysis."""
     filepath: Path
@@ -116,35 +173,74 @@ class PDFAnalysisResult:
     def get_issues_by_severity(self, severity: str) -> List[PDFIssue]:
         """Get all issues of a specific severity."""
         return [issue for issue in self.issues if issue.severity == severity]
-    
-    def print_report(self, console: Optional[Console] = None) -> None:
-        """Print a formatted report of the analysis results."""
-        if console is None:
-            console = Console()
-            
+
+    def to_json_dict(self) -> Dict[str, Any]:
+        """Build the JSON-serializable form stored in the ingestion log."""
+        return {
+            "filepath": str(self.filepath),
+            "filesize": self.filesize,
+            "num_pages": self.num_pages,
+            "is_encrypted": self.is_encrypted,
+            "is_damaged": self.is_damaged,
+            "encoding_types": [et.name for et in self.encoding_types],
+            "fonts": [
+                {
+                    "name": font.name,
+                    "type": font.type,
+                    "encoding": font.encoding.name,
+                    "embedded": font.embedded,
+                    "subset": font.subset
+                }
+                for font in self.fonts
+            ],
+            "issues": [
+                {
+                    "type": issue.type.name,
+                    "description": issue.description,
+                    "severity": issue.severity,
+                    "page_numbers": issue.page_numbers,
+                    "details": issue.details
+                }
+                for issue in self.issues
+            ],
+            "metadata": self.metadata
+        }
+
+    def build_report_renderables(self) -> List[Any]:
+        """
+        Build the Rich renderables that make up the analysis report.
+
+        Kept separate from printing so batch callers can reuse one Console
+        (or skip rendering entirely) across many results.
+        """
+        from rich.panel import Panel
+        from rich.table import Table
+
+        renderables = []
+
         # Basic file info
         file_info = Table.grid(padding=(0, 1))
         file_info.add_column(style="bold")
         file_info.add_column()
-        
+
         file_info.add_row("File:", str(self.filepath))
         file_info.add_row("Size:", f"{self.filesize / 1024 / 1024:.2f} MB")
         file_info.add_row("Pages:", str(self.num_pages))
         file_info.add_row("Encrypted:", "Yes" if self.is_encrypted else "No")
         file_info.add_row("Damaged:", "Yes" if self.is_damaged else "No")
-        
-        console.print(Panel(file_info, title="PDF File Information", expand=False))
-        
+
+        renderables.append(Panel(file_info, title="PDF File Information", expand=False))
+
         # Encoding types
-        console.print("\n[bold]Encoding Types:[/bold]")
+        renderables.append("\n[bold]Encoding Types:[/bold]")
         if self.encoding_types:
             for enc_type in self.encoding_types:
-                console.print(f"  • {enc_type.name}")
+                renderables.append(f"  • {enc_type.name}")
         else:
-            console.print("  • No specific encoding types detected")
-        
+            renderables.append("  • No specific encoding types detected")
+
         # Fonts
-        console.print("\n[bold]Fonts:[/bold]")
+        renderables.append("\n[bold]Fonts:[/bold]")
         if self.fonts:
             font_table = Table()
             font_table.add_column("Name", style="cyan")
@@ -152,7 +248,7 @@ class PDFAnalysisResult:
             font_table.add_column("Encoding", style="yellow")
             font_table.add_column("Embedded", style="magenta")
             font_table.add_column("Subset", style="blue")
-            
+
             for font in self.fonts:
                 font_table.add_row(
                     font.name,
@@ -161,11 +257,11 @@ class PDFAnalysisResult:
                     "Yes" if font.embedded else "No",
                     "Yes" if font.subset else "No"
                 )
-            
-            console.print(font_table)
+
+            renderables.append(font_table)
         else:
-            console.print("  • No fonts detected or extracted")
-        
+            renderables.append("  • No fonts detected or extracted")
+
         # Issues
         if self.issues:
             issue_table = Table(title="Issues")
@@ -173,37 +269,32 @@ class PDFAnalysisResult:
             issue_table.add_column("Description")
             issue_table.add_column("Severity", style="bold")
             issue_table.add_column("Pages")
-            
+
             for issue in self.issues:
-                pages = ", ".join(str(p) for p in issue.page_numbers) if issue.page_numbers else "All"
-                severity_style = {
-                    "low": "green",
-                    "medium": "yellow",
-                    "high": "red bold"
-                }.get(issue.severity, "")
-                
+                pages = ", ".join(map(str, issue.page_numbers)) if issue.page_numbers else "All"
+
                 issue_table.add_row(
                     issue.type.name,
                     issue.description,
-                    f"[{severity_style}]{issue.severity.upper()}[/{severity_style}]",
+                    _SEVERITY_MARKUP.get(issue.severity, issue.severity.upper()),
                     pages
                 )
-            
-            console.print("\n")
-            console.print(issue_table)
-        
+
+            renderables.append("\n")
+            renderables.append(issue_table)
+
         # Metadata
         if self.metadata:
             metadata_table = Table.grid(padding=(0, 1))
             metadata_table.add_column(style="bold")
             metadata_table.add_column()
-            
+
             for key, value in self.metadata.items():
                 metadata_table.add_row(key + ":", value)
-            
-            console.print("\n")
-            console.print(Panel(metadata_table, title="Metadata", expand=False))
-        
+
+            renderables.append("\n")
+            renderables.append(Panel(metadata_table, title="Metadata", expand=False))
+
         # Summary
         summary = []
         if self.has_critical_issues:
@@ -212,9 +303,20 @@ class PDFAnalysisResult:
             summary.append("[bold yellow]This PDF has some issues that might affect processing.[/bold yellow]")
         else:
             summary.append("[bold green]This PDF appears to be well-formed with no significant issues.[/bold green]")
-        
-        console.print("\n")
-        console.print(Panel("\n".join(summary), title="Summary", expand=False))
+
+        renderables.append("\n")
+        renderables.append(Panel("\n".join(summary), title="Summary", expand=False))
+
+        return renderables
+
+    def print_report(self, console: Optional["Console"] = None) -> None:
+        """Print a formatted report of the analysis results."""
+        if console is None:
+            from rich.console import Console
+            console = Console()
+
+        for renderable in self.build_report_renderables():
+            console.print(renderable)
 
 
 class PDFAnalyzer:
@@ -237,37 +339,60 @@ class PDFAnalyzer:
             verbose: Whether to print verbose output during analysis.
         """
         self.verbose = verbose
-        self.console = Console()
         self.logger = logging.getLogger("cake-gobbler.pdf_analyzer")
-        
+
+        # A Console is only needed for verbose banners; worker processes
+        # that just analyze never pay the rich import/terminal probe
+        self.console = None
+
+        # Results keyed by (path, mtime_ns, size); repeated analyses of an
+        # unchanged file skip the whole PyMuPDF/pikepdf round trip
+        self._result_cache: Dict[Tuple[str, int, int], PDFAnalysisResult] = {}
+
         # Create PyMuPDF interface
         self.pymupdf = PyMuPDFInterface(verbose=verbose)
-        
+
         if verbose:
+            from rich.console import Console
+            self.console = Console()
             self.console.print("[bold yellow]Running in verbose mode[/bold yellow]")
             # Print directly to stdout for maximum visibility
             print("VERBOSE MODE ENABLED - Debug information will be printed directly to console")
     
-    def analyze_file(self, filepath: str | Path, password: Optional[str] = None) -> PDFAnalysisResult:
+    def analyze_file(self, filepath: str | Path, password: Optional[str] = None, cache: bool = True) -> PDFAnalysisResult:
         """
         Analyze a PDF file for encoding types and potential issues.
-        
+
         Args:
             filepath: Path to the PDF file.
             password: Password for encrypted PDFs (if applicable).
-            
+            cache: Reuse the result for a file whose path, mtime, and size
+                are unchanged since a previous call on this analyzer.
+
         Returns:
             PDFAnalysisResult: Analysis results.
         """
         filepath = Path(filepath)
         if not filepath.exists():
             raise FileNotFoundError(f"File not found: {filepath}")
-        
+
+        stat_info = filepath.stat()
+        cache_key = (str(filepath), stat_info.st_mtime_ns, stat_info.st_size)
+        if cache:
+            cached = self._result_cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+        result = self._analyze_file_uncached(filepath, stat_info.st_size, password)
+        if cache:
+            self._result_cache[cache_key] = result
+        return result
+
+    def _analyze_file_uncached(self, filepath: Path, filesize: int, password: Optional[str]) -> PDFAnalysisResult:
+        """Run the actual analysis for analyze_file."""
         if self.verbose:
             print(f"DEBUG: Analyzing file: {filepath}")
-        
-        filesize = filepath.stat().st_size
-        
+
         # Initialize result
         result = PDFAnalysisResult(
             filepath=filepath,
@@ -316,13 +441,12 @@ class PDFAnalyzer:
             
             # Process encoding types
             for enc_type_str in analysis.get("encoding_types", []):
-                try:
-                    # Convert string encoding type to enum
-                    enc_type = EncodingType[enc_type_str]
+                # Convert string encoding type to enum
+                enc_type = _ENCODING_BY_NAME.get(enc_type_str)
+                if enc_type is not None:
                     result.encoding_types.add(enc_type)
-                except (KeyError, ValueError):
-                    if self.verbose:
-                        print(f"DEBUG: Unknown encoding type: {enc_type_str}")
+                elif self.verbose:
+                    print(f"DEBUG: Unknown encoding type: {enc_type_str}")
             
             # Process fonts
             for font_dict in analysis.get("fonts", []):
@@ -334,11 +458,8 @@ class PDFAnalyzer:
                     subset = font_dict.get("subset", False)
                     
                     # Convert string encoding to enum
-                    try:
-                        encoding = EncodingType[encoding_str]
-                    except (KeyError, ValueError):
-                        encoding = EncodingType.UNKNOWN
-                    
+                    encoding = _ENCODING_BY_NAME.get(encoding_str, EncodingType.UNKNOWN)
+
                     # Add font info
                     result.fonts.append(FontInfo(
                         name=font_name,
@@ -353,32 +474,11 @@ class PDFAnalyzer:
             
             # Process issues
             for issue_dict in analysis.get("issues", []):
-                try:
-                    issue_type_str = issue_dict.get("type", "UNKNOWN")
-                    description = issue_dict.get("description", "Unknown issue")
-                    severity = issue_dict.get("severity", "medium")
-                    page_numbers = issue_dict.get("page_numbers", [])
-                    details = issue_dict.get("details", {})
-                    
-                    # Convert string issue type to enum
-                    try:
-                        issue_type = PDFIssueType[issue_type_str]
-                    except (KeyError, ValueError):
-                        if self.verbose:
-                            print(f"DEBUG ERROR: Unknown issue type: {issue_type_str}")
-                        continue
-                    
-                    # Add issue
-                    result.issues.append(PDFIssue(
-                        type=issue_type,
-                        description=description,
-                        severity=severity,
-                        page_numbers=page_numbers,
-                        details=details
-                    ))
-                except Exception as e:
-                    if self.verbose:
-                        print(f"DEBUG ERROR: Failed to process issue: {str(e)}")
+                issue = PDFIssue.from_dict(issue_dict)
+                if issue is not None:
+                    result.issues.append(issue)
+                elif self.verbose:
+                    print(f"DEBUG ERROR: Unknown issue type: {issue_dict.get('type', 'UNKNOWN')}")
         
         except Exception as e:
             # If PyMuPDF client fails completely, try with pikepdf
@@ -396,23 +496,33 @@ class PDFAnalyzer:
     
     def _is_valid_pdf(self, filepath: Path) -> bool:
         """Check if the file is a valid PDF."""
+        # Only the 5-byte signature matters; a raw read skips the
+        # BufferedReader setup and the 1 KiB allocation per file
         try:
-            with open(filepath, 'rb') as f:
-                header = f.read(1024)
-                # Check for PDF signature
-                return header.startswith(b'%PDF-')
-        except Exception:
+            fd = os.open(filepath, os.O_RDONLY)
+            try:
+                header = os.read(fd, 5)
+            finally:
+                os.close(fd)
+            # Check for PDF signature
+            return header == b'%PDF-'
+        except OSError:
             return False
     
     def _analyze_with_pikepdf(self, filepath: Path, result: PDFAnalysisResult, password: Optional[str] = None) -> None:
         """Analyze PDF using pikepdf when PyMuPDF client fails."""
+        import pikepdf
+
         try:
             with pikepdf.open(filepath, password=password or '') as pdf:
                 result.num_pages = len(pdf.pages)
                 
-                # Extract metadata
+                # Extract metadata in one pass. Keys and values must both
+                # be plain strings here: the metadata dict is JSON-encoded
+                # into the ingestion log, which raw pikepdf objects (the
+                # keys are pikepdf Names) would break.
                 if pdf.docinfo:
-                    result.metadata = {k: str(v) for k, v in pdf.docinfo.items()}
+                    result.metadata = {str(k): str(v) for k, v in pdf.docinfo.items()}
                 
                 # Check for embedded files
                 if '/EmbeddedFiles' in pdf.Root:
@@ -441,72 +551,95 @@ class PDFAnalyzer:
                 severity="high"
             ))
     
-    def _extract_fonts_with_pikepdf(self, pdf: pikepdf.Pdf, result: PDFAnalysisResult) -> None:
+    def _extract_fonts_with_pikepdf(self, pdf: "pikepdf.Pdf", result: PDFAnalysisResult) -> None:
         """Extract fonts from the PDF using pikepdf."""
         if self.verbose:
             print(f"DEBUG: Extracting fonts with pikepdf")
         
-        font_set = set()  # Track unique fonts
-        
+        seen_objgens = set()  # Indirect font objects already parsed
+        font_set = set()  # Track unique fonts by name
+
+        # Accumulate locally and merge into the result once after the page
+        # walk, rather than growing the dataclass containers per font
+        found_encodings = set()
+        found_fonts = []
+        found_issues = []
+
         # Process each page
         for page_num, page in enumerate(pdf.pages):
             if '/Resources' not in page:
                 continue
-                
+
             resources = page.Resources
             if '/Font' not in resources:
                 continue
-                
+
             fonts = resources.Font
             for font_key in fonts.keys():
                 try:
-                    font_name = str(font_key)
                     font = fonts[font_key]
-                    
-                    # Get font properties
-                    font_type = str(font.get('/Subtype', '')) if '/Subtype' in font else 'Unknown'
-                    base_font = str(font.get('/BaseFont', '')) if '/BaseFont' in font else 'Unknown'
-                    encoding_str = str(font.get('/Encoding', '')) if '/Encoding' in font else 'Unknown'
-                    
-                    # Skip if we've already processed this font
+
+                    # Pages overwhelmingly share the same indirect font
+                    # objects; dedupe on the object identifier before paying
+                    # for any of the str() conversions below
+                    if font.is_indirect:
+                        objgen = font.objgen
+                        if objgen in seen_objgens:
+                            continue
+                        seen_objgens.add(objgen)
+
+                    # Get font properties: each .get crosses the pybind11
+                    # boundary once, instead of a contains-check plus get
+                    subtype = font.get('/Subtype')
+                    font_type = str(subtype) if subtype is not None else 'Unknown'
+                    base = font.get('/BaseFont')
+                    base_font = str(base) if base is not None else 'Unknown'
+                    enc = font.get('/Encoding')
+                    encoding_str = str(enc) if enc is not None else 'Unknown'
+
+                    # Skip if we've already processed this font (name-level
+                    # fallback, mainly for direct font dictionaries)
                     if base_font in font_set:
                         continue
-                    
+
                     font_set.add(base_font)
                     
                     if self.verbose:
                         print(f"DEBUG: Found font on page {page_num+1}: {base_font}, Type: {font_type}, Encoding: {encoding_str}")
                     
-                    # Determine encoding type
-                    encoding = EncodingType.UNKNOWN
-                    if 'Identity-H' in encoding_str:
-                        encoding = EncodingType.IDENTITY_H
-                        result.encoding_types.add(EncodingType.IDENTITY_H)
-                    elif 'WinAnsi' in encoding_str:
-                        encoding = EncodingType.WINANSI
-                        result.encoding_types.add(EncodingType.WINANSI)
-                    elif 'MacRoman' in encoding_str:
-                        encoding = EncodingType.MACROMAN
-                        result.encoding_types.add(EncodingType.MACROMAN)
-                    elif 'Custom' in encoding_str:
-                        encoding = EncodingType.CUSTOM
-                        result.encoding_types.add(EncodingType.CUSTOM)
+                    # Determine encoding type: one dict probe for the common
+                    # name values, substring matching only when that misses
+                    encoding = _FONT_ENCODING_MAP.get(encoding_str)
+                    if encoding is None:
+                        if 'Identity-H' in encoding_str:
+                            encoding = EncodingType.IDENTITY_H
+                        elif 'WinAnsi' in encoding_str:
+                            encoding = EncodingType.WINANSI
+                        elif 'MacRoman' in encoding_str:
+                            encoding = EncodingType.MACROMAN
+                        elif 'Custom' in encoding_str:
+                            encoding = EncodingType.CUSTOM
+                        else:
+                            encoding = EncodingType.UNKNOWN
+                    if encoding is not EncodingType.UNKNOWN:
+                        found_encodings.add(encoding)
                     
                     # Check if font is embedded
-                    is_embedded = False
-                    is_subset = False
-                    
-                    if '/FontDescriptor' in font:
-                        font_descriptor = font.FontDescriptor
-                        if '/FontFile' in font_descriptor or '/FontFile2' in font_descriptor or '/FontFile3' in font_descriptor:
-                            is_embedded = True
-                    
-                    # Check if font is subset (name starts with a prefix like ABCDEF+)
-                    if '+' in base_font:
-                        is_subset = True
+                    font_descriptor = font.get('/FontDescriptor')
+                    is_embedded = font_descriptor is not None and (
+                        '/FontFile' in font_descriptor
+                        or '/FontFile2' in font_descriptor
+                        or '/FontFile3' in font_descriptor
+                    )
+
+                    # Check if font is subset: subset names carry a
+                    # six-letter ABCDEF+ prefix, and base_font is the
+                    # stringified Name including its leading '/', so the
+                    # '+' sits at index 7
+                    is_subset = '+' in base_font[:8]
                     
                     # Add font info
-                    result.fonts.append(FontInfo(
+                    found_fonts.append(FontInfo(
                         name=base_font,
                         type=font_type,
                         encoding=encoding,
@@ -516,7 +649,7 @@ class PDFAnalyzer:
                     
                     # Check for missing fonts
                     if not is_embedded and font_type not in ('/Type1', '/MMType1'):
-                        result.issues.append(PDFIssue(
+                        found_issues.append(PDFIssue(
                             type=PDFIssueType.MISSING_FONTS,
                             description=f"Non-embedded font: {base_font}",
                             severity="medium",
@@ -525,48 +658,41 @@ class PDFAnalyzer:
                 except Exception as e:
                     if self.verbose:
                         print(f"DEBUG ERROR: Failed to process font {font_key} on page {page_num+1}: {str(e)}")
-    
+
+        # One C-level merge per container
+        result.encoding_types.update(found_encodings)
+        result.fonts.extend(found_fonts)
+        result.issues.extend(found_issues)
+
     def _detect_encoding_with_chardet(self, text_bytes: bytes) -> Tuple[str, float, EncodingType]:
         """
-        Detect text encoding using chardet.
-        
+        Detect text encoding using charset-normalizer.
+
         Args:
             text_bytes: Bytes to analyze
-            
+
         Returns:
             Tuple of (encoding_name, confidence, encoding_type)
         """
-        import chardet
-        
-        # First check for BOM
-        if text_bytes.startswith(b'\xFE\xFF'):
-            return ('UTF-16BE', 1.0, EncodingType.UTF16BE_WITH_BOM)
-        elif text_bytes.startswith(b'\xFF\xFE'):
-            return ('UTF-16LE', 1.0, EncodingType.UTF16LE_WITH_BOM)
-        elif text_bytes.startswith(b'\xEF\xBB\xBF'):
-            return ('UTF-8', 1.0, EncodingType.UTF8_WITH_BOM)
-        
-        # If no BOM, use chardet
-        result = chardet.detect(text_bytes)
-        encoding_name = result['encoding']
-        confidence = result['confidence']
-        
-        # Map the encoding name to our EncodingType enum
+        from charset_normalizer import from_bytes
+
+        # First check for BOM: two dict probes on the byte prefixes instead
+        # of a startswith chain
+        bom_hit = _BOM_DISPATCH.get(text_bytes[:3]) or _BOM_DISPATCH.get(text_bytes[:2])
+        if bom_hit:
+            return bom_hit
+
+        # If no BOM, score the bytes with charset-normalizer, whose
+        # classifier runs far faster than the pure-Python chardet it replaces
+        best = from_bytes(text_bytes).best()
+        encoding_name = None
+        confidence = 0.0
         encoding_type = EncodingType.UNKNOWN
-        if encoding_name:
-            encoding_name = encoding_name.upper()
-            if encoding_name == 'ASCII':
-                encoding_type = EncodingType.ASCII
-            elif encoding_name == 'UTF-8':
-                encoding_type = EncodingType.UTF8
-            elif encoding_name == 'UTF-16BE':
-                encoding_type = EncodingType.UTF16BE
-            elif encoding_name == 'UTF-16LE':
-                encoding_type = EncodingType.UTF16LE
-            elif encoding_name == 'ISO-8859-1' or encoding_name == 'LATIN1':
-                encoding_type = EncodingType.LATIN1
-            else:
-                encoding_type = EncodingType.CUSTOM
+        if best is not None and best.encoding:
+            confidence = 1.0 - best.chaos
+            # best.encoding is a Python codec name (e.g. 'utf_16_be')
+            encoding_type = _CODEC_ENCODING_MAP.get(best.encoding, EncodingType.CUSTOM)
+            encoding_name = best.encoding.replace('_', '-').upper()
         
         # If confidence is low or no encoding detected, check for UTF-16 patterns
         if not encoding_name or confidence < self.ENCODING_CONFIDENCE_THRESHOLD:
@@ -593,10 +719,12 @@ class PDFAnalyzer:
         # Check for BE pattern (null byte, char, null byte, char)
         # Take a sample of the first 100 bytes or less
         sample_size = min(100, len(text_bytes))
-        
-        # Count null bytes at even and odd positions
-        even_nulls = sum(1 for i in range(0, sample_size, 2) if i < len(text_bytes) and text_bytes[i] == 0)
-        odd_nulls = sum(1 for i in range(1, sample_size, 2) if i < len(text_bytes) and text_bytes[i] == 0)
+
+        # Count null bytes at even and odd positions; stepped bytes slices
+        # plus count() run entirely in C, and for a 100-byte sample beat
+        # building a numpy view of the buffer
+        even_nulls = text_bytes[:sample_size:2].count(0)
+        odd_nulls = text_bytes[1:sample_size:2].count(0)
         
         # Calculate the percentage of null bytes at each position
         even_null_percentage = even_nulls / ((sample_size + 1) // 2)
@@ -611,3 +739,4 @@ class PDFAnalyzer:
             return ('UTF-16LE', 0.9, EncodingType.UTF16LE)
         
         return None
+
@@ -22,7 +22,7 @@ from cake_gobbler.models.pdf_models import PDFAnalysisResult, PDFIssue, PDFIssue
 from cake_gobbler.utils.pymupdf_interface import PyMuPDFInterface
 
 
-@dataclass
+@dataclass(slots=True)
 class ExtractionResult:
     """Results of a text extraction operation."""
     text: str
@@ -301,3 +301,4 @@ class PDFProcessor:
         }
         
         return metadata
+
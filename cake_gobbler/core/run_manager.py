@@ -11,6 +11,7 @@ storing run metadata in the database. It also manages shared resources
 like embedding models to optimize memory usage and performance.
 """
 
+import threading
 import uuid
 import datetime
 from typing import Dict, Any, Optional, List, Union
@@ -37,6 +38,10 @@ class RunManager:
         """
         self.db_manager = db_manager
         self.embedding_model_managers = embedding_model_managers
+        # The driver thread (skip/error paths) and the ingest pipeline's
+        # finalize worker both update counters; the lock keeps the
+        # read-modify-write and the absolute-value DB update atomic
+        self._counter_lock = threading.Lock()
         self.run_id = None
         self.start_time = None
         self.end_time = None
@@ -134,15 +139,16 @@ class RunManager:
         if not self.run_id:
             raise ValueError("No run in progress. Call start_run() first.")
         
-        self.processed_files += 1
-        
-        # Update run data in database
-        self.db_manager.update_run(
-            self.run_id,
-            processed_files=self.processed_files
-        )
-        
-        return self.processed_files
+        with self._counter_lock:
+            self.processed_files += 1
+
+            # Update run data in database
+            self.db_manager.update_run(
+                self.run_id,
+                processed_files=self.processed_files
+            )
+
+            return self.processed_files
     
     def increment_failed(self) -> int:
         """
@@ -154,15 +160,16 @@ class RunManager:
         if not self.run_id:
             raise ValueError("No run in progress. Call start_run() first.")
         
-        self.failed_files += 1
-        
-        # Update run data in database
-        self.db_manager.update_run(
-            self.run_id,
-            failed_files=self.failed_files
-        )
-        
-        return self.failed_files
+        with self._counter_lock:
+            self.failed_files += 1
+
+            # Update run data in database
+            self.db_manager.update_run(
+                self.run_id,
+                failed_files=self.failed_files
+            )
+
+            return self.failed_files
     
     def increment_skipped(self) -> int:
         """
@@ -174,15 +181,16 @@ class RunManager:
         if not self.run_id:
             raise ValueError("No run in progress. Call start_run() first.")
         
-        self.skipped_files += 1
-        
-        # Update run data in database
-        self.db_manager.update_run(
-            self.run_id,
-            skipped_files=self.skipped_files
-        )
-        
-        return self.skipped_files
+        with self._counter_lock:
+            self.skipped_files += 1
+
+            # Update run data in database
+            self.db_manager.update_run(
+                self.run_id,
+                skipped_files=self.skipped_files
+            )
+
+            return self.skipped_files
         
     def increment_already_processed(self) -> int:
         """
@@ -194,17 +202,18 @@ class RunManager:
         if not self.run_id:
             raise ValueError("No run in progress. Call start_run() first.")
         
-        self.already_processed_files += 1
-        
-        # Update already_processed_files and skipped_files
-        self.skipped_files += 1
-        self.db_manager.update_run(
-            self.run_id,
-            already_processed_files=self.already_processed_files,
-            skipped_files=self.skipped_files
-        )
-        
-        return self.already_processed_files
+        with self._counter_lock:
+            self.already_processed_files += 1
+
+            # Update already_processed_files and skipped_files
+            self.skipped_files += 1
+            self.db_manager.update_run(
+                self.run_id,
+                already_processed_files=self.already_processed_files,
+                skipped_files=self.skipped_files
+            )
+
+            return self.already_processed_files
     
     def get_run_stats(self) -> RunStatistics:
         """
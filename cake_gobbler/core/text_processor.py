@@ -34,7 +34,14 @@ class TextProcessor:
         self.chunk_overlap = chunk_overlap
         self.verbose = verbose
         self.logger = logging.getLogger("cake-gobbler.text_processor")
-        
+
+        # One splitter for the processor's lifetime; constructing it per
+        # call re-resolves the tiktoken encoder for every file
+        self.text_splitter = TokenTextSplitter(
+            chunk_size=chunk_size,
+            chunk_overlap=chunk_overlap
+        )
+
         # Ensure NLTK resources are downloaded
         self._download_nltk_resources()
     
@@ -59,13 +66,8 @@ class TextProcessor:
         """
         self.logger.info(f"Splitting text into chunks (chunk_size={self.chunk_size}, overlap={self.chunk_overlap})")
 
-        text_splitter = TokenTextSplitter(
-            chunk_size=self.chunk_size,
-            chunk_overlap=self.chunk_overlap
-        )
-        
         try:
-            chunks = text_splitter.split_text(text)
+            chunks = self.text_splitter.split_text(text)
             
             # Log each chunk with formatting and character count
             #for i, chunk in enumerate(chunks, 1):
@@ -112,11 +114,11 @@ class TextProcessor:
         """
         self.logger.info(f"Embedding {len(chunks)} chunks")
         try:
-            embeddings = model.encode(chunks, show_progress_bar=True)
-            
-            # Convert to list format
-            embeddings_list = [embedding.tolist() for embedding in embeddings]
-            
+            embeddings = model.encode(chunks, show_progress_bar=False, convert_to_numpy=True)
+
+            # One C-level traversal instead of a Python call per row
+            embeddings_list = embeddings.tolist()
+
             self.logger.info(f"Embedded chunks successfully; embedding dimension: {len(embeddings_list[0]) if embeddings_list else 0}")
             return embeddings_list
         except Exception as e:
@@ -9,13 +9,14 @@ This module handles all operations related to Weaviate, including connection,
 collection creation, and storage of embeddings.
 """
 
+import atexit
 import json
 import logging
 import os
 import uuid
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Tuple
 import datetime
- 
+
 import weaviate
 from weaviate.collections.classes.config import DataType
 from weaviate.config import AdditionalConfig, Timeout
@@ -43,10 +44,16 @@ class WeaviateManager:
     def connect(self) -> None:
         """
         Connect to the Weaviate instance.
-        
+
+        Reuses the existing client if already connected, so repeated calls
+        do not pay the connection/handshake cost again.
+
         Raises:
             ConnectionError: If unable to connect to Weaviate
         """
+        if self.client is not None:
+            return
+
         self.logger.info(f"Connecting to Weaviate at {self.config.http_host}:{self.config.http_port}")
         try:
             # Debug configuration values before connection
@@ -168,16 +175,17 @@ class WeaviateManager:
             self.logger.info(f"Created collection '{collection_name}'")
             return collection
     
-    def store_chunks(self, collection, chunks: List[str], embeddings: List[List[float]], metadata: Dict[str, Any]) -> None:
+    def store_chunks(self, collection, chunks: List[str], embeddings: Any, metadata: Dict[str, Any]) -> None:
         """
         Store chunks and embeddings in Weaviate.
-        
+
         Args:
             collection: The Weaviate collection object
             chunks: List of text chunks
-            embeddings: List of embeddings
+            embeddings: Embeddings, one row per chunk (numpy array or list
+                of lists; the client accepts either for vectors)
             metadata: Metadata to store with each chunk
-            
+
         Raises:
             ValueError: If the number of chunks and embeddings do not match
         """
@@ -188,7 +196,14 @@ class WeaviateManager:
         
         self.logger.info(f"Storing {len(chunks)} chunks in Weaviate")
         try:
-            with collection.batch.dynamic() as batch:
+            # Fixed-size batches keep the number of round-trips at
+            # O(chunks / batch_size) instead of growing with chunk count,
+            # and concurrent_requests keeps several batches in flight so
+            # inserts do not serialize behind a single gRPC stream
+            with collection.batch.fixed_size(
+                batch_size=self.config.batch_size,
+                concurrent_requests=self.config.concurrent_requests
+            ) as batch:
                 for i, (chunk, embedding) in enumerate(zip(chunks, embeddings)):
                     chunk_metadata = metadata.copy()
                     chunk_metadata["chunk_index"] = i
@@ -298,3 +313,70 @@ class WeaviateManager:
             error_msg = f"Error deleting objects from collection '{collection_name}': {str(e)}"
             self.logger.error(error_msg)
             raise
+
+    def delete_by_file_paths(self, collection_name: str, full_paths: List[str]) -> Dict[str, Any]:
+        """
+        Delete all chunks whose full_path matches any of the provided paths,
+        batching the filter so huge stale sets don't build one oversized
+        contains_any predicate.
+
+        Args:
+            collection_name: Name of the collection (must follow Weaviate PascalCase convention)
+            full_paths: The full path values to match
+
+        Returns:
+            Dictionary with the last batch's deletion response
+        """
+        if not full_paths:
+            return {}
+
+        if not self.client:
+            self.connect()
+
+        try:
+            collection = self.client.collections.get(collection_name)
+            if not collection.exists():
+                self.logger.info(f"Collection '{collection_name}' not found")
+                return {}
+
+            response = {}
+            for start in range(0, len(full_paths), 500):
+                batch = full_paths[start:start + 500]
+                response = collection.data.delete_many(
+                    where=Filter.by_property("full_path").contains_any(batch)
+                )
+
+            self.logger.info(f"Deleted objects for {len(full_paths)} paths from collection '{collection_name}', response: {response}")
+            return response
+        except Exception as e:
+            error_msg = f"Error deleting objects from collection '{collection_name}': {str(e)}"
+            self.logger.error(error_msg)
+            raise
+
+
+# Process-wide cache of managers keyed by connection endpoints, so repeated
+# operations in one CLI invocation share a single persistent connection
+# instead of reconnecting per command or per file.
+_manager_cache: Dict[Tuple[str, int, str, int], WeaviateManager] = {}
+
+
+def get_weaviate_manager(config: WeaviateConfig) -> WeaviateManager:
+    """
+    Get a shared WeaviateManager for the given connection configuration.
+
+    The manager (and its underlying client connection) is cached for the
+    lifetime of the process and closed automatically at exit.
+
+    Args:
+        config: Weaviate connection configuration
+
+    Returns:
+        A shared WeaviateManager instance
+    """
+    key = (config.http_host, config.http_port, config.grpc_host, config.grpc_port)
+    manager = _manager_cache.get(key)
+    if manager is None:
+        manager = WeaviateManager(config)
+        _manager_cache[key] = manager
+        atexit.register(manager.close)
+    return manager
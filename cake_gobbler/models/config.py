@@ -17,7 +17,7 @@ from dotenv import load_dotenv
 load_dotenv()
 
 
-@dataclass
+@dataclass(slots=True)
 class WeaviateConfig:
     """Configuration for Weaviate connection."""
     http_host: str = os.getenv("WEAVIATE_HTTP_HOST", "weaviate.weaviate")
@@ -25,9 +25,11 @@ class WeaviateConfig:
     grpc_host: str = os.getenv("WEAVIATE_GRPC_HOST", "weaviate-grpc.weaviate")
     grpc_port: int = int(os.getenv("WEAVIATE_GRPC_PORT") or "50051")
     timeout: int = int(os.getenv("WEAVIATE_TIMEOUT") or "10")  # Reduced default timeout for faster connection error detection
+    batch_size: int = int(os.getenv("WEAVIATE_BATCH_SIZE") or "100")  # Objects per insert batch
+    concurrent_requests: int = int(os.getenv("WEAVIATE_CONCURRENT_REQUESTS") or "2")  # Parallel in-flight insert batches
 
 
-@dataclass
+@dataclass(slots=True)
 class ProcessingConfig:
     """Configuration for PDF processing."""
     chunk_size: int = int(os.getenv("CHUNK_SIZE", "1024"))
@@ -37,7 +39,7 @@ class ProcessingConfig:
     ray_workers: int = int(os.getenv("RAY_WORKERS", "1"))
 
 
-@dataclass
+@dataclass(slots=True)
 class AppConfig:
     """Main application configuration."""
     weaviate: WeaviateConfig
@@ -13,7 +13,7 @@ from datetime import datetime
 from typing import Dict, Any, Optional, List
 
 
-@dataclass
+@dataclass(slots=True)
 class IngestionRecord:
     """Represents a record of a PDF ingestion in the database."""
     id: Optional[int] = None
@@ -33,7 +33,7 @@ class IngestionRecord:
     file_fingerprint: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class RunRecord:
     """Represents a record of a processing run in the database."""
     run_id: str
@@ -55,7 +55,7 @@ class RunRecord:
     chunk_overlap: Optional[int] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class RunStatistics:
     """Statistics for a processing run."""
     run_id: str
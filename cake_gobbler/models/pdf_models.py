@@ -9,11 +9,11 @@ This module defines data models related to PDF analysis and processing.
 """
 
 from dataclasses import dataclass, field
-from enum import Enum, auto
+from enum import IntEnum, auto
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Tuple
+from typing import Any, Dict, List, Optional, Set, Tuple
 
-class EncodingType(Enum):
+class EncodingType(IntEnum):
     """Enum representing different PDF encoding types."""
     ASCII = auto()
     UTF8 = auto()
@@ -31,7 +31,7 @@ class EncodingType(Enum):
     UNKNOWN = auto()
 
 
-class PDFIssueType(Enum):
+class PDFIssueType(IntEnum):
     """Enum representing different types of PDF issues."""
     PASSWORD_PROTECTED = auto()
     DAMAGED = auto()
@@ -52,7 +52,7 @@ class PDFIssueType(Enum):
     MIXED_ENCODINGS = auto()
 
 
-@dataclass
+@dataclass(slots=True)
 class FontInfo:
     """Information about a font used in the PDF."""
     name: str
@@ -62,7 +62,7 @@ class FontInfo:
     subset: bool
 
 
-@dataclass
+@dataclass(slots=True)
 class PDFIssue:
     """Represents an issue found in a PDF file."""
     type: PDFIssueType
@@ -72,7 +72,7 @@ class PDFIssue:
     details: Dict[str, str] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class PDFAnalysisResult:
     """Results of a PDF encoding and structure analysis."""
     filepath: Path
@@ -102,3 +102,35 @@ class PDFAnalysisResult:
     def get_issues_by_severity(self, severity: str) -> List[PDFIssue]:
         """Get all issues of a specific severity."""
         return [issue for issue in self.issues if issue.severity == severity]
+
+    def to_json_dict(self) -> Dict[str, Any]:
+        """Build the JSON-serializable form stored in the ingestion log."""
+        return {
+            "filepath": str(self.filepath),
+            "filesize": self.filesize,
+            "num_pages": self.num_pages,
+            "is_encrypted": self.is_encrypted,
+            "is_damaged": self.is_damaged,
+            "encoding_types": [et.name for et in self.encoding_types],
+            "fonts": [
+                {
+                    "name": font.name,
+                    "type": font.type,
+                    "encoding": font.encoding.name,
+                    "embedded": font.embedded,
+                    "subset": font.subset
+                }
+                for font in self.fonts
+            ],
+            "issues": [
+                {
+                    "type": issue.type.name,
+                    "description": issue.description,
+                    "severity": issue.severity,
+                    "page_numbers": issue.page_numbers,
+                    "details": issue.details
+                }
+                for issue in self.issues
+            ],
+            "metadata": self.metadata
+        }
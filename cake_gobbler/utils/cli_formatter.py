@@ -12,6 +12,19 @@ from typing import Dict, Any, Optional, List, Union, Tuple
 from rich.console import Console
 from rich.table import Table
 
+# Status -> color, shared by every status cell; built once instead of per call
+_STATUS_COLORS = {
+    "success": "green",
+    "error": "red",
+    "skipped": "yellow",
+    "failed": "red",
+    "already_processed": "blue",
+    "running": "yellow",
+    "completed": "green",
+    "completed_with_errors": "yellow",
+    "not_started": "white"
+}
+
 
 def create_status_table(
     title: str, 
@@ -54,18 +67,8 @@ def format_status_color(status: str) -> str:
     Returns:
         Formatted status with color
     """
-    color = {
-        "success": "green",
-        "error": "red",
-        "skipped": "yellow",
-        "failed": "red",
-        "already_processed": "blue",
-        "running": "yellow",
-        "completed": "green",
-        "completed_with_errors": "yellow",
-        "not_started": "white"
-    }.get(status.lower(), "white")
-    
+    color = _STATUS_COLORS.get(status.lower(), "white")
+
     return f"[{color}]{status}[/{color}]"
 
 
@@ -12,36 +12,51 @@ import os
 import hashlib
 import datetime
 from pathlib import Path
-from typing import List, Tuple
+from typing import Iterator, List, Tuple
+
+
+def iter_pdf_files(path: str) -> Iterator[str]:
+    """
+    Yield PDF files from a directory tree (or a single file) lazily.
+    Skips hidden directories (those starting with a dot).
+
+    Args:
+        path: Path to a PDF file or directory of PDFs
+
+    Yields:
+        Absolute PDF file paths
+    """
+    if os.path.isdir(path):
+        yield from _scan_for_pdfs(path)
+    elif os.path.isfile(path) and path.lower().endswith('.pdf'):
+        yield os.path.abspath(path)
+
+
+def _scan_for_pdfs(directory: str) -> Iterator[str]:
+    """Recursively scan a directory for PDF files using os.scandir."""
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                # Skip hidden directories
+                if not entry.name.startswith('.'):
+                    yield from _scan_for_pdfs(entry.path)
+            # Case-insensitive check for .pdf extension
+            elif entry.is_file() and entry.name.lower().endswith('.pdf'):
+                yield os.path.abspath(entry.path)
 
 
 def find_pdf_files(path: str) -> List[str]:
     """
     Find all PDF files in a directory or return a single file.
     Skips hidden directories (those starting with a dot).
-    
+
     Args:
         path: Path to a PDF file or directory of PDFs
-        
+
     Returns:
         List of absolute PDF file paths
     """
-    pdf_files = []
-    
-    if os.path.isdir(path):
-        # Use os.walk to traverse all subdirectories
-        for root, dirs, files in os.walk(path):
-            # Skip hidden directories (in-place modification of dirs)
-            dirs[:] = [d for d in dirs if not d.startswith('.')]
-            
-            for file in files:
-                # Case-insensitive check for .pdf extension
-                if file.lower().endswith('.pdf'):
-                    pdf_files.append(os.path.abspath(os.path.join(root, file)))
-    elif os.path.isfile(path) and path.lower().endswith('.pdf'):
-        pdf_files = [os.path.abspath(path)]
-
-    return pdf_files
+    return list(iter_pdf_files(path))
 
 def calculate_file_fingerprint(file_path: str) -> str:
     """